@@ -64,11 +64,17 @@ class Config:
     NEO4J_USER = os.environ.get('NEO4J_USER', 'neo4j')
     NEO4J_PASSWORD = os.environ.get('NEO4J_PASSWORD')
     NEO4J_DATABASE = os.environ.get('NEO4J_DATABASE', 'neo4j')
+    NEO4J_MAX_CONNECTION_POOL_SIZE = int(os.environ.get('NEO4J_MAX_CONNECTION_POOL_SIZE', '50'))  # 驱动连接池上限
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(os.environ.get('NEO4J_CONNECTION_ACQUISITION_TIMEOUT', '60'))  # 获取连接超时（秒）
+    NEO4J_MAX_TRANSACTION_RETRY_TIME = float(os.environ.get('NEO4J_MAX_TRANSACTION_RETRY_TIME', '30'))  # 事务重试总时长（秒）
 
     # Qdrant 配置（VECTOR_BACKEND=qdrant）
     QDRANT_URL = os.environ.get('QDRANT_URL', 'http://localhost:6333')
     QDRANT_API_KEY = os.environ.get('QDRANT_API_KEY')
     QDRANT_COLLECTION_CHUNKS = os.environ.get('QDRANT_COLLECTION_CHUNKS', 'mirofish_chunks')
+    QDRANT_USE_GRPC = os.environ.get('QDRANT_USE_GRPC', 'False').lower() == 'true'  # 设为 true 优先使用 gRPC 传输（需开放 QDRANT_GRPC_PORT），默认 HTTP
+    QDRANT_GRPC_PORT = int(os.environ.get('QDRANT_GRPC_PORT', '6334'))
+    QDRANT_BATCH_SIZE = int(os.environ.get('QDRANT_BATCH_SIZE', '64'))  # 每次批量 embedding + upsert 的文本块数
     
     # 文件上传配置
     MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50MB
@@ -78,6 +84,10 @@ class Config:
     # 文本处理配置
     DEFAULT_CHUNK_SIZE = 500  # 默认切块大小
     DEFAULT_CHUNK_OVERLAP = 50  # 默认重叠大小
+
+    # 本地图谱构建配置（GRAPH_BACKEND=local）
+    EXTRACT_CONCURRENCY = int(os.environ.get('EXTRACT_CONCURRENCY', '8'))  # 并发执行的实体/关系抽取 LLM 请求数
+    GRAPH_BUILD_BATCH_SIZE = int(os.environ.get('GRAPH_BUILD_BATCH_SIZE', '50'))  # 每批写入 Neo4j/Qdrant 的文本块数
     
     # OASIS模拟配置
     OASIS_DEFAULT_MAX_ROUNDS = int(os.environ.get('OASIS_DEFAULT_MAX_ROUNDS', '10'))
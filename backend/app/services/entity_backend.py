@@ -2,15 +2,23 @@
 Entity reader backend factory.
 
 Switches between ZepEntityReader and LocalEntityReader based on Config.GRAPH_BACKEND.
+Readers are cached per backend so drivers/clients are set up once per process.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from ..config import Config
 
 
 def get_entity_reader():
-    if Config.GRAPH_BACKEND == "local":
+    return _get_entity_reader(Config.GRAPH_BACKEND)
+
+
+@lru_cache(maxsize=None)
+def _get_entity_reader(backend: str):
+    if backend == "local":
         from .local_entity_reader import LocalEntityReader
 
         return LocalEntityReader()
@@ -18,4 +26,3 @@ def get_entity_reader():
     from .zep_entity_reader import ZepEntityReader
 
     return ZepEntityReader()
-
@@ -9,6 +9,7 @@ To reduce duplicate nodes, we normalize types into a small canonical set:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -18,125 +19,172 @@ CANONICAL_PRODUCT = "Product"
 CANONICAL_LOCATION = "Location"
 
 
+# Fast path for the most frequent raw types (canonical names, lowercase variants, common CN terms)
+_FAST = {
+    CANONICAL_PERSON: CANONICAL_PERSON,
+    CANONICAL_ORGANIZATION: CANONICAL_ORGANIZATION,
+    CANONICAL_PRODUCT: CANONICAL_PRODUCT,
+    CANONICAL_LOCATION: CANONICAL_LOCATION,
+    "person": CANONICAL_PERSON,
+    "organization": CANONICAL_ORGANIZATION,
+    "product": CANONICAL_PRODUCT,
+    "location": CANONICAL_LOCATION,
+    "人物": CANONICAL_PERSON,
+    "公司": CANONICAL_ORGANIZATION,
+    "产品": CANONICAL_PRODUCT,
+    "地点": CANONICAL_LOCATION,
+}
+
+# Chinese hints (best-effort substring matches)
+_CN_PERSON = ("人物", "个人", "人", "当事人")
+_CN_ORGANIZATION = ("组织", "机构", "公司", "企业", "政府", "部门", "媒体", "平台", "账号", "协会", "大学")
+_CN_PRODUCT = ("产品", "应用", "软件", "系统", "品牌", "模型")
+_CN_LOCATION = ("地点", "位置", "城市", "国家", "地区", "省", "市", "县", "区")
+
+# Heuristic buckets (English-ish types from ontology)
+_PERSON_TOKENS = frozenset({
+    "person",
+    "people",
+    "individual",
+    "actor",
+    "leader",
+    "celebrity",
+    "expert",
+    "scholar",
+    "journalist",
+    "student",
+    "citizen",
+    "witness",
+    "victim",
+    "perpetrator",
+    "influencer",
+    "opinionleader",
+    "kols",
+    "kol",
+})
+_ORGANIZATION_TOKENS = frozenset({
+    "organization",
+    "org",
+    "company",
+    "enterprise",
+    "brand",
+    "agency",
+    "department",
+    "government",
+    "regulator",
+    "university",
+    "school",
+    "institute",
+    "ngo",
+    "union",
+    "association",
+    "foundation",
+    "media",
+    "newspaper",
+    "tv",
+    "platform",
+    "committee",
+    "community",
+    "account",
+})
+_PRODUCT_TOKENS = frozenset({
+    "product",
+    "app",
+    "application",
+    "service",
+    "tool",
+    "model",
+    "software",
+    "system",
+    "api",
+    "framework",
+    "device",
+    "game",
+})
+_LOCATION_TOKENS = frozenset({
+    "location",
+    "place",
+    "city",
+    "country",
+    "province",
+    "region",
+    "state",
+    "county",
+    "district",
+    "area",
+})
+
+# PascalCase hints (substring matches on the lowercased type)
+_HINT_ORGANIZATION = ("account", "agency", "company", "org", "platform", "media", "university", "school")
+_HINT_PRODUCT = ("product", "app", "model", "service", "system", "software")
+_HINT_LOCATION = ("location", "place", "city", "country", "province", "region", "district")
+_HINT_PERSON = ("person", "individual", "actor", "leader", "expert", "student", "journalist")
+
+_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+# ASCII fast path for tokenizing: every ASCII char outside [a-z0-9] becomes a space (same split as _SPLIT_RE)
+_ASCII_SEPARATORS = str.maketrans({
+    c: " " for c in map(chr, range(128)) if not ("a" <= c <= "z" or "0" <= c <= "9")
+})
+
+
+def _keyword_re(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    # One alternation per bucket: a single scan in the regex engine instead of a Python-level any() loop.
+    return re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
+
+_CN_PERSON_RE = _keyword_re(_CN_PERSON)
+_CN_ORGANIZATION_RE = _keyword_re(_CN_ORGANIZATION)
+_CN_PRODUCT_RE = _keyword_re(_CN_PRODUCT)
+_CN_LOCATION_RE = _keyword_re(_CN_LOCATION)
+_HINT_ORGANIZATION_RE = _keyword_re(_HINT_ORGANIZATION)
+_HINT_PRODUCT_RE = _keyword_re(_HINT_PRODUCT)
+_HINT_LOCATION_RE = _keyword_re(_HINT_LOCATION)
+_HINT_PERSON_RE = _keyword_re(_HINT_PERSON)
+
+
+@lru_cache(maxsize=4096)
 def canonicalize_entity_type(raw_type: Optional[str]) -> str:
     t = (raw_type or "").strip()
     if not t:
         return "Entity"
 
     # Exact matches (most common)
-    if t in {CANONICAL_PERSON, CANONICAL_ORGANIZATION, CANONICAL_PRODUCT, CANONICAL_LOCATION}:
-        return t
+    hit = _FAST.get(t)
+    if hit:
+        return hit
 
-    tl = t.lower()
-
-    # Chinese hints (best-effort)
-    if any(k in t for k in ("人物", "个人", "人", "当事人")):
+    if _CN_PERSON_RE.search(t):
         return CANONICAL_PERSON
-    if any(k in t for k in ("组织", "机构", "公司", "企业", "政府", "部门", "媒体", "平台", "账号", "协会", "大学")):
+    if _CN_ORGANIZATION_RE.search(t):
         return CANONICAL_ORGANIZATION
-    if any(k in t for k in ("产品", "应用", "软件", "系统", "品牌", "模型")):
+    if _CN_PRODUCT_RE.search(t):
         return CANONICAL_PRODUCT
-    if any(k in t for k in ("地点", "位置", "城市", "国家", "地区", "省", "市", "县", "区")):
+    if _CN_LOCATION_RE.search(t):
         return CANONICAL_LOCATION
 
-    # Heuristic buckets (English-ish types from ontology)
-    person_tokens = {
-        "person",
-        "people",
-        "individual",
-        "actor",
-        "leader",
-        "celebrity",
-        "expert",
-        "scholar",
-        "journalist",
-        "student",
-        "citizen",
-        "witness",
-        "victim",
-        "perpetrator",
-        "influencer",
-        "opinionleader",
-        "kols",
-        "kol",
-    }
-    org_tokens = {
-        "organization",
-        "org",
-        "company",
-        "enterprise",
-        "brand",
-        "agency",
-        "department",
-        "government",
-        "regulator",
-        "university",
-        "school",
-        "institute",
-        "ngo",
-        "union",
-        "association",
-        "foundation",
-        "media",
-        "newspaper",
-        "tv",
-        "platform",
-        "committee",
-        "community",
-        "account",
-    }
-    product_tokens = {
-        "product",
-        "app",
-        "application",
-        "service",
-        "tool",
-        "model",
-        "software",
-        "system",
-        "api",
-        "framework",
-        "device",
-        "game",
-    }
-    location_tokens = {
-        "location",
-        "place",
-        "city",
-        "country",
-        "province",
-        "region",
-        "state",
-        "county",
-        "district",
-        "area",
-    }
-
-    def _tokenize(s: str) -> set[str]:
-        parts = re.split(r"[^a-z0-9]+", s.lower())
-        return {p for p in parts if p}
-
-    tokens = _tokenize(tl)
-
-    if tokens & person_tokens:
+    tl = t.lower()
+    if tl.isascii():
+        tokens = set(tl.translate(_ASCII_SEPARATORS).split())
+    else:
+        tokens = {p for p in _SPLIT_RE.split(tl) if p}
+
+    if tokens & _PERSON_TOKENS:
         return CANONICAL_PERSON
-    if tokens & location_tokens:
+    if tokens & _LOCATION_TOKENS:
         return CANONICAL_LOCATION
-    if tokens & product_tokens:
+    if tokens & _PRODUCT_TOKENS:
         return CANONICAL_PRODUCT
-    if tokens & org_tokens:
+    if tokens & _ORGANIZATION_TOKENS:
         return CANONICAL_ORGANIZATION
 
-    # PascalCase hints
-    if any(k in tl for k in ("account", "agency", "company", "org", "platform", "media", "university", "school")):
+    if _HINT_ORGANIZATION_RE.search(tl):
         return CANONICAL_ORGANIZATION
-    if any(k in tl for k in ("product", "app", "model", "service", "system", "software")):
+    if _HINT_PRODUCT_RE.search(tl):
         return CANONICAL_PRODUCT
-    if any(k in tl for k in ("location", "place", "city", "country", "province", "region", "district")):
+    if _HINT_LOCATION_RE.search(tl):
         return CANONICAL_LOCATION
-    if any(k in tl for k in ("person", "individual", "actor", "leader", "expert", "student", "journalist")):
+    if _HINT_PERSON_RE.search(tl):
         return CANONICAL_PERSON
 
     # Unknown: keep original to avoid over-merging
     return t
-
@@ -2,15 +2,23 @@
 Graph backend factory.
 
 Provides a unified way to obtain the graph builder based on Config.GRAPH_BACKEND.
+Builders are cached per backend so drivers/clients are set up once per process.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from ..config import Config
 
 
 def get_graph_builder():
-    if Config.GRAPH_BACKEND == "local":
+    return _get_graph_builder(Config.GRAPH_BACKEND)
+
+
+@lru_cache(maxsize=None)
+def _get_graph_builder(backend: str):
+    if backend == "local":
         from .local_graph_builder import LocalGraphBuilderService
 
         return LocalGraphBuilderService()
@@ -19,4 +27,3 @@ def get_graph_builder():
     from .graph_builder import GraphBuilderService
 
     return GraphBuilderService(api_key=Config.ZEP_API_KEY)
-
@@ -7,10 +7,11 @@ can keep using FilteredEntities/EntityNode data structures.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from ..utils.logger import get_logger
-from .local_graph_store import LocalNeo4jGraphStore
+from .local_graph_store import get_local_graph_store
 from .entity_type_normalizer import canonicalize_entity_type
 from .zep_entity_reader import EntityNode, FilteredEntities
 
@@ -19,7 +20,7 @@ logger = get_logger("mirofish.local_entity_reader")
 
 class LocalEntityReader:
     def __init__(self):
-        self.store = LocalNeo4jGraphStore()
+        self.store = get_local_graph_store()
 
     def filter_defined_entities(
         self,
@@ -27,95 +28,102 @@ class LocalEntityReader:
         defined_entity_types: Optional[List[str]] = None,
         enrich_with_edges: bool = True,
     ) -> FilteredEntities:
-        graph_data = self.store.get_graph_data(graph_id)
-        nodes = graph_data.get("nodes") or []
-        edges = graph_data.get("edges") or []
-
-        total_count = len(nodes)
-
-        # Filter by entity type (label after "Entity")
-        def _entity_type(node: Dict[str, Any]) -> Optional[str]:
-            labels = node.get("labels") or []
-            for label in labels:
-                if label not in ["Entity", "Node"]:
-                    return label
-            return None
+        nodes, edges = self.store.get_entity_graph(graph_id)
 
-        filtered_nodes = []
-        entity_types: Set[str] = set()
-        defined_set = set(defined_entity_types or [])
-        canonical_defined_set = {canonicalize_entity_type(t) for t in defined_set} if defined_set else set()
-        for n in nodes:
-            et = _entity_type(n)
-            if et:
-                entity_types.add(et)
-            if defined_set:
-                # Accept if canonical label matches canonicalized defined types,
-                # OR if the node records any original extracted types matching the requested list.
-                if et not in canonical_defined_set:
-                    src_types = (n.get("attributes") or {}).get("source_entity_types") or []
-                    if not (set(src_types) & defined_set):
-                        continue
-            filtered_nodes.append(n)
-
-        filtered_uuids = {n.get("uuid") for n in filtered_nodes if n.get("uuid")}
-
-        related_edges_by_uuid: Dict[str, List[Dict[str, Any]]] = {u: [] for u in filtered_uuids}
-        related_nodes_by_uuid: Dict[str, List[Dict[str, Any]]] = {u: [] for u in filtered_uuids}
-
-        if enrich_with_edges:
-            for e in edges:
-                su = e.get("source_node_uuid")
-                tu = e.get("target_node_uuid")
-                if su in filtered_uuids:
-                    related_edges_by_uuid[su].append(e)
-                if tu in filtered_uuids and tu != su:
-                    related_edges_by_uuid[tu].append(e)
-
-            # Build node lookup
-            node_lookup = {n.get("uuid"): n for n in nodes if n.get("uuid")}
-            for u in filtered_uuids:
-                rel_nodes = set()
-                for e in related_edges_by_uuid.get(u, []):
-                    su = e.get("source_node_uuid")
-                    tu = e.get("target_node_uuid")
-                    other = tu if su == u else su
-                    if other and other in node_lookup:
-                        rel_nodes.add(other)
-                related_nodes_by_uuid[u] = [node_lookup[oid] for oid in rel_nodes]
-
-        entities: List[EntityNode] = []
-        for n in filtered_nodes:
-            uuid_ = n.get("uuid") or ""
-            entities.append(
-                EntityNode(
-                    uuid=uuid_,
-                    name=n.get("name") or "",
-                    labels=n.get("labels") or ["Entity"],
-                    summary=n.get("summary") or "",
-                    attributes=n.get("attributes") or {},
-                    related_edges=related_edges_by_uuid.get(uuid_, []),
-                    related_nodes=related_nodes_by_uuid.get(uuid_, []),
-                )
-            )
+        entity_types: Set[str] = {n.get_entity_type() for n in nodes} - {None}
+        entities = list(self._iter_filtered(nodes, edges, defined_entity_types, enrich_with_edges))
 
         return FilteredEntities(
             entities=entities,
             entity_types=entity_types,
-            total_count=total_count,
+            total_count=len(nodes),
             filtered_count=len(entities),
         )
 
-    def get_entity_with_context(self, graph_id: str, entity_uuid: str) -> Optional[EntityNode]:
-        filtered = self.filter_defined_entities(
-            graph_id=graph_id,
-            defined_entity_types=None,
-            enrich_with_edges=True,
+    @staticmethod
+    def _iter_filtered(
+        nodes: List[EntityNode],
+        edges: List[Dict[str, Any]],
+        defined_entity_types: Optional[List[str]],
+        enrich_with_edges: bool,
+    ) -> Iterator[EntityNode]:
+        # Built once; per-node checks are plain membership tests without temporary sets.
+        allowed = frozenset(defined_entity_types) if defined_entity_types else None
+        canonical_allowed = frozenset(canonicalize_entity_type(t) for t in allowed) if allowed else None
+
+        edges_by_uuid: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        node_lookup: Dict[str, EntityNode] = {}
+        if enrich_with_edges:
+            # Single pass over edges, indexed by endpoint; per-node work happens lazily in _enrich().
+            for e in edges:
+                su = e["source_node_uuid"]
+                tu = e["target_node_uuid"]
+                if su:
+                    edges_by_uuid[su].append(e)
+                if tu and tu != su:
+                    edges_by_uuid[tu].append(e)
+            node_lookup = {n.uuid: n for n in nodes if n.uuid}
+
+        for n in nodes:
+            if allowed is not None:
+                # Filter by entity type (label after "Entity"): accept if the canonical label matches
+                # canonicalized defined types, OR if the node records any original extracted types
+                # matching the requested list.
+                if n.get_entity_type() not in canonical_allowed and allowed.isdisjoint(
+                    n.attributes.get("source_entity_types") or ()
+                ):
+                    continue
+            if enrich_with_edges:
+                LocalEntityReader._enrich(n, node_lookup, edges_by_uuid)
+            yield n
+
+    @staticmethod
+    def _enrich(
+        node: EntityNode,
+        node_lookup: Dict[str, EntityNode],
+        edges_by_uuid: Dict[str, List[Dict[str, Any]]],
+    ) -> None:
+        u = node.uuid
+        related_edges = edges_by_uuid.get(u) if u else None
+        if not related_edges:
+            return
+        node.related_edges = related_edges
+
+        others: Dict[str, None] = {}
+        for e in related_edges:
+            su = e["source_node_uuid"]
+            other = e["target_node_uuid"] if su == u else su
+            if other and other in node_lookup:
+                others[other] = None
+        node.related_nodes = [
+            {
+                "uuid": node_lookup[o].uuid,
+                "name": node_lookup[o].name,
+                "labels": node_lookup[o].labels,
+                "summary": node_lookup[o].summary,
+            }
+            for o in others
+        ]
+
+    @staticmethod
+    def _to_entity_node(item: Dict[str, Any]) -> EntityNode:
+        node = item["node"]
+        return EntityNode(
+            uuid=node.get("uuid") or "",
+            name=node.get("name") or "",
+            labels=node.get("labels") or ["Entity"],
+            summary=node.get("summary") or "",
+            attributes=node.get("attributes") or {},
+            related_edges=item.get("edges") or [],
+            related_nodes=item.get("neighbors") or [],
         )
-        for e in filtered.entities:
-            if e.uuid == entity_uuid:
-                return e
-        return None
+
+    def get_entity_with_context(self, graph_id: str, entity_uuid: str) -> Optional[EntityNode]:
+        # Single-entity lookup is pushed down to Neo4j instead of loading the whole graph.
+        item = self.store.get_node_with_neighbors(graph_id=graph_id, entity_uuid=entity_uuid)
+        if item is None:
+            return None
+        return self._to_entity_node(item)
 
     def get_entities_by_type(
         self,
@@ -123,9 +131,9 @@ class LocalEntityReader:
         entity_type: str,
         enrich_with_edges: bool = True,
     ) -> List[EntityNode]:
-        filtered = self.filter_defined_entities(
+        items = self.store.get_nodes_by_type(
             graph_id=graph_id,
-            defined_entity_types=[entity_type],
-            enrich_with_edges=enrich_with_edges,
+            entity_types=[entity_type],
+            with_neighbors=enrich_with_edges,
         )
-        return filtered.entities
+        return [self._to_entity_node(item) for item in items]
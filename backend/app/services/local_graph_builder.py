@@ -8,16 +8,19 @@ stores chunk embeddings into Qdrant.
 from __future__ import annotations
 
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from ..config import Config
 from ..utils.logger import get_logger
 from .text_processor import TextProcessor
 from .local_graph_extractor import LocalGraphExtractor
-from .local_graph_store import LocalEntity, LocalNeo4jGraphStore, LocalRelation
-from .entity_type_normalizer import canonicalize_entity_type
-from .local_vector_store import QdrantChunkStore
+from .local_graph_store import LocalRelation, dumps_json, get_local_graph_store, stable_entity_uuid
+from .local_vector_store import QdrantChunkStore, get_qdrant_chunk_store
+from .tools_backend import invalidate_local_graph_caches
 
 logger = get_logger("mirofish.local_graph_builder")
 
@@ -26,9 +29,48 @@ def _now_iso() -> str:
     return datetime.now().isoformat()
 
 
+def _entity_key(canonical_type: Optional[str], name: Optional[str]) -> str:
+    """Dedupe key with the same identity as stable_entity_uuid: type as-is, normalized name."""
+    return f"{canonical_type or ''}:{(name or '').strip().lower()}"
+
+
+@dataclass
+class _SeenEntity:
+    """
+    What has already been written for an entity during the current build.
+
+    A repeated mention is only re-upserted when it adds a new source type, or a non-empty
+    summary/attributes that differ from the last ones written (last non-empty wins, as when
+    every mention was upserted); otherwise it is just linked to its chunk.
+    """
+
+    uuid: str
+    written: bool = False
+    source_types: Set[str] = field(default_factory=set)
+    summary: str = ""
+    attributes_json: str = ""
+
+    def record(self, raw_type: str, summary: str, attributes_json: str) -> bool:
+        """Record a mention; returns True if it carries information not yet written."""
+        is_new = (
+            not self.written
+            or (raw_type and raw_type not in self.source_types)
+            or (summary and summary != self.summary)
+            or (attributes_json and attributes_json != self.attributes_json)
+        )
+        self.written = True
+        if raw_type:
+            self.source_types.add(raw_type)
+        if summary:
+            self.summary = summary
+        if attributes_json:
+            self.attributes_json = attributes_json
+        return bool(is_new)
+
+
 class LocalGraphBuilderService:
     def __init__(self):
-        self.store = LocalNeo4jGraphStore()
+        self.store = get_local_graph_store()
         self.extractor = LocalGraphExtractor()
         self.vector_store = None  # lazy init
 
@@ -38,17 +80,140 @@ class LocalGraphBuilderService:
         if self.vector_store is not None:
             return self.vector_store
         try:
-            self.vector_store = QdrantChunkStore()
+            self.vector_store = get_qdrant_chunk_store()
         except Exception as e:
             logger.warning(f"Qdrant init failed, vector features disabled: {e}")
             self.vector_store = None
         return self.vector_store
 
+    def _add_chunk_vectors(
+        self, project_id: str, graph_id: str, chunk_rows: List[Tuple[str, str]], wait: bool = False
+    ) -> None:
+        # Vector store is optional
+        vector_store = self._get_vector_store()
+        if vector_store is None:
+            return
+        try:
+            vector_store.add_chunks(
+                project_id=project_id,
+                graph_id=graph_id,
+                chunks=chunk_rows,
+                extra_payload={"type": "chunk"},
+                wait=wait,
+            )
+        except Exception as e:
+            logger.warning(f"Qdrant add_chunks failed, continue without vectors: {e}")
+
+    def _write_batch(
+        self,
+        project_id: str,
+        graph_id: str,
+        batch: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        seen_entities: Dict[str, _SeenEntity],
+    ) -> Tuple[int, int]:
+        """
+        Persist a batch of (chunk_id, chunk_text, extracted) with a few bulk statements.
+        extracted is None when extraction failed; the chunk itself is still stored.
+
+        Returns (entity mentions in the batch, entity rows actually upserted).
+
+        seen_entities (canonical key -> _SeenEntity) lives for the whole build: entities already
+        written with the same information are only linked to the chunk, and relations can resolve
+        endpoints extracted from earlier chunks.
+        """
+        chunk_rows = [(chunk_id, chunk) for chunk_id, chunk, _ in batch]
+        self.store.upsert_chunks_bulk(project_id=project_id, graph_id=graph_id, chunks=chunk_rows)
+
+        entity_rows: Dict[str, Dict[str, Any]] = {}
+        mentions: List[Tuple[str, List[str]]] = []
+        relations: List[LocalRelation] = []
+        # One timestamp for everything staged in this batch
+        created_at = _now_iso()
+
+        for chunk_id, _, extracted in batch:
+            if extracted is None:
+                continue
+            entities_in_chunk = extracted.get("entities") or []
+            relations_in_chunk = extracted.get("relations") or []
+
+            # Stage entities as plain rows for the bulk UNWIND upsert, one row per uuid
+            chunk_uuids: List[str] = []
+            for ent in entities_in_chunk:
+                raw_type = ent.get("type", "")
+                # Normalized once per entity by the extractor (memoized per distinct raw type)
+                canonical_type = ent["canonical_type"]
+                name = ent.get("name", "")
+                summary = ent.get("summary", "") or ""
+                attributes = ent.get("attributes") or {}
+
+                key = _entity_key(canonical_type, name)
+                seen = seen_entities.get(key)
+                if seen is None:
+                    seen = _SeenEntity(uuid=stable_entity_uuid(project_id, canonical_type, name))
+                    seen_entities[key] = seen
+                chunk_uuids.append(seen.uuid)
+                # Empty attributes never overwrite (matches the Cypher upsert)
+                attributes_json = dumps_json(attributes) if attributes else ""
+                if not seen.record(raw_type, summary, attributes_json):
+                    continue
+
+                row = entity_rows.get(seen.uuid)
+                if row is None:
+                    entity_rows[seen.uuid] = {
+                        "uuid": seen.uuid,
+                        "project_id": project_id,
+                        "graph_id": graph_id,
+                        "name": name,
+                        "entity_type": canonical_type,
+                        "summary": summary,
+                        "attributes_json": attributes_json or "{}",
+                        "source_entity_types": [raw_type] if raw_type else [],
+                        "created_at": created_at,
+                    }
+                    continue
+                # Merge into the pending row the same way the Cypher upsert merges into the node.
+                if summary:
+                    row["summary"] = summary
+                if attributes:
+                    row["attributes_json"] = attributes_json
+                if raw_type and raw_type not in row["source_entity_types"]:
+                    row["source_entity_types"].append(raw_type)
+            mentions.append((chunk_id, chunk_uuids))
+
+            for rel in relations_in_chunk:
+                source = seen_entities.get(_entity_key(rel.get("source_canonical_type"), rel.get("source")))
+                if source is None:
+                    continue
+                target = seen_entities.get(_entity_key(rel.get("target_canonical_type"), rel.get("target")))
+                if target is None:
+                    continue
+                relations.append(
+                    LocalRelation(
+                        project_id=project_id,
+                        graph_id=graph_id,
+                        source_uuid=source.uuid,
+                        target_uuid=target.uuid,
+                        relation_name=rel.get("relation", ""),
+                        fact=rel.get("fact", ""),
+                        attributes=rel.get("attributes") or {},
+                        created_at=created_at,
+                    )
+                )
+
+        self.store.upsert_entities_bulk(list(entity_rows.values()))
+        self.store.link_mentions_bulk(graph_id=graph_id, mentions=mentions)
+        self.store.upsert_relations(relations)
+
+        return sum(len(uuids) for _, uuids in mentions), len(entity_rows)
+
     def create_graph(self, project_id: str, name: str, ontology: Optional[Dict[str, Any]] = None) -> str:
         return self.store.create_graph(project_id=project_id, name=name, ontology=ontology)
 
     def delete_graph(self, graph_id: str):
-        return self.store.delete_graph(graph_id)
+        try:
+            return self.store.delete_graph(graph_id)
+        finally:
+            invalidate_local_graph_caches(graph_id)
 
     def get_graph_data(self, graph_id: str) -> Dict[str, Any]:
         return self.store.get_graph_data(graph_id)
@@ -71,90 +236,105 @@ class LocalGraphBuilderService:
 
         graph_id = self.create_graph(project_id=project_id, name=graph_name, ontology=ontology)
 
-        chunks = TextProcessor.split_text(text, chunk_size, chunk_overlap)
-        total = max(len(chunks), 1)
+        workers = max(Config.EXTRACT_CONCURRENCY, 1)
+        batch_size = max(Config.GRAPH_BUILD_BATCH_SIZE, 1)
+        max_inflight = max(workers * 2, batch_size)
+        # Chunks are produced lazily, so progress starts from an estimate and switches to the
+        # real count (submitted_chunks) as soon as the chunker has run past it or finished.
+        estimated_total = len(text) // max(chunk_size - chunk_overlap, 1) + 1
+        submitted_chunks = 0
+        chunking_done = False
+
+        processed_chunks = 0
         failed_extract_chunks = 0
+        entity_mentions = 0
+        entity_upserts = 0
+        pending: Deque[Tuple[str, str, Future]] = deque()
+        batch: List[Tuple[str, str, Optional[Dict[str, Any]]]] = []
+        seen_entities: Dict[str, _SeenEntity] = {}
 
-        for idx, chunk in enumerate(chunks):
-            ratio = idx / total
-            if progress_callback:
-                progress_callback(f"抽取实体/关系: {idx+1}/{len(chunks)}", 0.05 + ratio * 0.85)
+        def _flush() -> None:
+            nonlocal entity_mentions, entity_upserts
+            mentions, upserts = self._write_batch(
+                project_id=project_id, graph_id=graph_id, batch=batch, seen_entities=seen_entities
+            )
+            entity_mentions += mentions
+            entity_upserts += upserts
+            batch.clear()
 
-            chunk_id = f"chunk_{uuid.uuid4().hex[:12]}"
-            self.store.upsert_chunk(project_id=project_id, graph_id=graph_id, chunk_id=chunk_id, text=chunk)
+        def _drain(limit: int) -> None:
+            nonlocal processed_chunks, failed_extract_chunks
+            while len(pending) > limit:
+                chunk_id, chunk, future = pending.popleft()
+                processed_chunks += 1
+                if progress_callback:
+                    if chunking_done:
+                        total, label = submitted_chunks, f"{processed_chunks}/{submitted_chunks}"
+                    else:
+                        total = max(estimated_total, submitted_chunks)
+                        label = f"{processed_chunks}/~{total}"
+                    ratio = min(processed_chunks / total, 1.0)
+                    progress_callback(f"抽取实体/关系: {label}", 0.05 + ratio * 0.85)
 
-            # Vector store is optional
-            vector_store = self._get_vector_store()
-            if vector_store is not None:
+                extracted: Optional[Dict[str, Any]] = None
                 try:
-                    vector_store.add_chunk(
-                        project_id=project_id,
-                        graph_id=graph_id,
-                        chunk_id=chunk_id,
-                        text=chunk,
-                        extra_payload={"type": "chunk"},
-                    )
+                    extracted = future.result()
                 except Exception as e:
-                    logger.warning(f"Qdrant add_chunk failed, continue without vectors: {e}")
+                    failed_extract_chunks += 1
+                    logger.warning(f"Extractor failed for chunk {processed_chunks}; skipping: {e}")
+                batch.append((chunk_id, chunk, extracted))
 
-            try:
-                extracted = self.extractor.extract(chunk, ontology=ontology)
-            except Exception as e:
-                failed_extract_chunks += 1
-                logger.warning(f"Extractor failed for chunk {idx+1}/{len(chunks)}; skipping: {e}")
-                continue
-            entities_in_chunk = extracted.get("entities") or []
-            relations_in_chunk = extracted.get("relations") or []
+                if len(batch) >= batch_size:
+                    _flush()
 
-            entities: List[LocalEntity] = []
-            for ent in entities_in_chunk:
-                raw_type = ent.get("type", "")
-                canonical_type = canonicalize_entity_type(raw_type)
-                entities.append(
-                    LocalEntity(
-                        project_id=project_id,
-                        graph_id=graph_id,
-                        name=ent.get("name", ""),
-                        entity_type=canonical_type,
-                        summary=ent.get("summary", ""),
-                        attributes=ent.get("attributes") or {},
-                        source_entity_types=[raw_type] if raw_type else [],
-                        created_at=_now_iso(),
-                    )
-                )
+        # Chunk vectors are embedded/upserted QDRANT_BATCH_SIZE at a time on a background worker.
+        use_vectors = self._get_vector_store() is not None
+        vector_batch_size = max(Config.QDRANT_BATCH_SIZE, 1)
+        vector_rows: List[Tuple[str, str]] = []
 
-            entity_uuids = self.store.upsert_entities(entities)
-            self.store.link_mentions(chunk_id=chunk_id, entity_uuids=entity_uuids, graph_id=graph_id)
+        # Producer/consumer: splitting (CPU) and LLM extraction (I/O) overlap, with bounded in-flight chunks.
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool, ThreadPoolExecutor(max_workers=1) as vector_pool:
+                try:
+                    for chunk in TextProcessor.iter_text(text, chunk_size, chunk_overlap):
+                        chunk_id = f"chunk_{uuid.uuid4().hex[:12]}"
+                        pending.append((chunk_id, chunk, pool.submit(self.extractor.extract, chunk, ontology)))
+                        submitted_chunks += 1
+                        if use_vectors:
+                            # A full batch is only sent once more chunks follow, so the last one is never empty.
+                            if len(vector_rows) >= vector_batch_size:
+                                vector_pool.submit(self._add_chunk_vectors, project_id, graph_id, vector_rows)
+                                vector_rows = []
+                            vector_rows.append((chunk_id, chunk))
+                        _drain(max_inflight - 1)
+                    if vector_rows:
+                        # Acknowledged upsert, so the cache clear below comes after the points are visible.
+                        vector_pool.submit(self._add_chunk_vectors, project_id, graph_id, vector_rows, True)
+                    chunking_done = True
+                    _drain(0)
+                except BaseException:
+                    # Surface the error now instead of waiting for every queued LLM extraction and
+                    # embedding batch on pool exit; only a batch already running is waited for.
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    vector_pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            if use_vectors:
+                # The vector worker has finished by now. Batches sent before a failed final upsert may
+                # already be searchable, so drop this graph's cached searches whatever the outcome.
+                self._get_vector_store().clear_search_cache(graph_id)
 
-            # Map for name+type -> uuid
-            uuid_by_key: Dict[str, str] = {}
-            for ent in entities:
-                uuid_by_key[f"{ent.entity_type}:{ent.name}".lower()] = ent.uuid
+        if batch:
+            _flush()
 
-            relations: List[LocalRelation] = []
-            for rel in relations_in_chunk:
-                s_type = canonicalize_entity_type(rel.get("source_type"))
-                t_type = canonicalize_entity_type(rel.get("target_type"))
-                s_key = f"{s_type}:{rel.get('source')}".lower()
-                t_key = f"{t_type}:{rel.get('target')}".lower()
-                source_uuid = uuid_by_key.get(s_key)
-                target_uuid = uuid_by_key.get(t_key)
-                if not source_uuid or not target_uuid:
-                    continue
-                relations.append(
-                    LocalRelation(
-                        project_id=project_id,
-                        graph_id=graph_id,
-                        source_uuid=source_uuid,
-                        target_uuid=target_uuid,
-                        relation_name=rel.get("relation", ""),
-                        fact=rel.get("fact", ""),
-                        attributes=rel.get("attributes") or {},
-                        created_at=_now_iso(),
-                    )
-                )
+        # Repeated mentions are deduplicated via seen_entities and only linked, not re-upserted.
+        logger.info(
+            f"Local graph {graph_id}: {processed_chunks} chunks, {entity_mentions} entity mentions, "
+            f"{len(seen_entities)} distinct entities, {entity_upserts} entity upserts"
+        )
 
-            self.store.upsert_relations(relations)
+        # Report tools may have cached a partial view of this graph while it was being written.
+        invalidate_local_graph_caches(graph_id)
 
         if progress_callback:
             progress_callback("读取图谱数据...", 0.95)
@@ -162,7 +342,7 @@ class LocalGraphBuilderService:
         graph_data = self.get_graph_data(graph_id)
         if failed_extract_chunks:
             graph_data["build_warnings"] = [
-                f"Extractor failed for {failed_extract_chunks}/{len(chunks)} chunks; graph may be incomplete."
+                f"Extractor failed for {failed_extract_chunks}/{processed_chunks} chunks; graph may be incomplete."
             ]
         if progress_callback:
             progress_callback("完成", 1.0)
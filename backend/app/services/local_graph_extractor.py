@@ -7,22 +7,92 @@ Given a text chunk and an ontology, it returns structured entities and relations
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..config import Config
-from ..utils.llm_client import LLMClient
+from ..utils.llm_client import LLMClient, get_llm_client
 from ..utils.logger import get_logger
+from .entity_type_normalizer import canonicalize_entity_type
 
 logger = get_logger("mirofish.local_graph_extractor")
 
 
+def _default_prompt_fields(entity_types: List[str], edge_types: List[str]) -> Dict[str, Any]:
+    return {
+        "allowed_entity_types": entity_types,
+        "allowed_relation_types": edge_types,
+        "requirements": {
+            "only_use_allowed_types": True,
+            "deduplicate_entities_by_name_and_type": True,
+            "do_not_guess": True,
+            "return_empty_when_none": True,
+        },
+        "output_schema": {
+            "entities": [
+                {"name": "string", "type": "string", "summary": "string", "attributes": {"key": "value"}}
+            ],
+            "relations": [
+                {
+                    "source": "string",
+                    "source_type": "string",
+                    "target": "string",
+                    "target_type": "string",
+                    "relation": "string",
+                    "fact": "string",
+                    "attributes": {"key": "value"},
+                }
+            ],
+        },
+    }
+
+
+def _safe_prompt_fields(entity_types: List[str], edge_types: List[str]) -> Dict[str, Any]:
+    return {
+        "allowed_entity_types": entity_types,
+        "allowed_relation_types": edge_types,
+        "requirements": {
+            "only_use_allowed_types": True,
+            "deduplicate_entities_by_name_and_type": True,
+            "do_not_guess": True,
+            "return_empty_when_none": True,
+            "avoid_quoting_input": True,
+        },
+        "output_schema": {
+            "entities": [{"name": "string", "type": "string", "summary": "", "attributes": {}}],
+            "relations": [
+                {
+                    "source": "string",
+                    "source_type": "string",
+                    "target": "string",
+                    "target_type": "string",
+                    "relation": "string",
+                    "fact": "",
+                    "attributes": {},
+                }
+            ],
+        },
+    }
+
+
+_PROMPT_FIELDS = {"default": _default_prompt_fields, "safe": _safe_prompt_fields}
+
+
 class LocalGraphExtractor:
     def __init__(self, llm: Optional[LLMClient] = None):
-        self.llm = llm or LLMClient(
-            api_key=Config.EXTRACT_API_KEY,
-            base_url=Config.EXTRACT_BASE_URL,
-            model=Config.EXTRACT_MODEL_NAME,
-        )
+        self.llm = llm or get_llm_client("extract")
+        # Serialized ontology part of the user prompt, keyed by (mode, entity_types, edge_types)
+        self._prompt_suffix_cache: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], str] = {}
+
+    def _user_prompt(self, text: str, mode: str, entity_types: List[str], edge_types: List[str]) -> str:
+        """
+        Build the JSON user message. Only `text` changes between chunks of one build, so the
+        ontology/requirements/schema part is serialized once and reused.
+        """
+        key = (mode, tuple(entity_types), tuple(edge_types))
+        suffix = self._prompt_suffix_cache.get(key)
+        if suffix is None:
+            suffix = json.dumps(_PROMPT_FIELDS[mode](entity_types, edge_types), ensure_ascii=False)
+            self._prompt_suffix_cache[key] = suffix
+        return '{"text": ' + json.dumps(text, ensure_ascii=False) + ", " + suffix[1:]
 
     @staticmethod
     def _is_data_inspection_failed(err: Exception) -> bool:
@@ -48,37 +118,10 @@ class LocalGraphExtractor:
             "If the input might trigger moderation, redact details using '[REDACTED]' and keep outputs minimal.\n"
         )
 
-        user = {
-            "text": text,
-            "allowed_entity_types": entity_types,
-            "allowed_relation_types": edge_types,
-            "requirements": {
-                "only_use_allowed_types": True,
-                "deduplicate_entities_by_name_and_type": True,
-                "do_not_guess": True,
-                "return_empty_when_none": True,
-                "avoid_quoting_input": True,
-            },
-            "output_schema": {
-                "entities": [{"name": "string", "type": "string", "summary": "", "attributes": {}}],
-                "relations": [
-                    {
-                        "source": "string",
-                        "source_type": "string",
-                        "target": "string",
-                        "target_type": "string",
-                        "relation": "string",
-                        "fact": "",
-                        "attributes": {},
-                    }
-                ],
-            },
-        }
-
         return self.llm.chat_json(
             messages=[
                 {"role": "system", "content": system},
-                {"role": "user", "content": json.dumps(user, ensure_ascii=False)},
+                {"role": "user", "content": self._user_prompt(text, "safe", entity_types, edge_types)},
             ],
             temperature=0.0,
             max_tokens=1536,
@@ -88,10 +131,14 @@ class LocalGraphExtractor:
         """
         Returns:
             {
-              "entities": [{"name": "...", "type": "...", "summary": "...", "attributes": {...}}],
-              "relations": [{"source": "...", "source_type": "...", "target": "...", "target_type": "...",
+              "entities": [{"name": "...", "type": "...", "canonical_type": "...", "summary": "...",
+                            "attributes": {...}}],
+              "relations": [{"source": "...", "source_type": "...", "source_canonical_type": "...",
+                             "target": "...", "target_type": "...", "target_canonical_type": "...",
                              "relation": "...", "fact": "...", "attributes": {...}}]
             }
+
+            Canonical types are computed once here so the builder never re-normalizes.
         """
         entity_types = [e.get("name") for e in (ontology or {}).get("entity_types", []) if e.get("name")]
         edge_types = [e.get("name") for e in (ontology or {}).get("edge_types", []) if e.get("name")]
@@ -102,39 +149,11 @@ class LocalGraphExtractor:
             "不要输出任何解释或多余文本。"
         )
 
-        user = {
-            "text": text,
-            "allowed_entity_types": entity_types,
-            "allowed_relation_types": edge_types,
-            "requirements": {
-                "only_use_allowed_types": True,
-                "deduplicate_entities_by_name_and_type": True,
-                "do_not_guess": True,
-                "return_empty_when_none": True,
-            },
-            "output_schema": {
-                "entities": [
-                    {"name": "string", "type": "string", "summary": "string", "attributes": {"key": "value"}}
-                ],
-                "relations": [
-                    {
-                        "source": "string",
-                        "source_type": "string",
-                        "target": "string",
-                        "target_type": "string",
-                        "relation": "string",
-                        "fact": "string",
-                        "attributes": {"key": "value"},
-                    }
-                ],
-            },
-        }
-
         try:
             result = self.llm.chat_json(
                 messages=[
                     {"role": "system", "content": system},
-                    {"role": "user", "content": json.dumps(user, ensure_ascii=False, indent=2)},
+                    {"role": "user", "content": self._user_prompt(text, "default", entity_types, edge_types)},
                 ],
                 temperature=0.2,
                 max_tokens=2048,
@@ -163,10 +182,12 @@ class LocalGraphExtractor:
                 continue
             if entity_types and etype not in entity_types:
                 continue
+            etype = str(etype).strip()
             cleaned_entities.append(
                 {
                     "name": str(name).strip(),
-                    "type": str(etype).strip(),
+                    "type": etype,
+                    "canonical_type": canonicalize_entity_type(etype),
                     "summary": str((ent or {}).get("summary") or "").strip(),
                     "attributes": (ent or {}).get("attributes") or {},
                 }
@@ -184,12 +205,16 @@ class LocalGraphExtractor:
                 continue
             if edge_types and rel_name not in edge_types:
                 continue
+            source_type = str(source_type).strip()
+            target_type = str(target_type).strip()
             cleaned_relations.append(
                 {
                     "source": str(source).strip(),
-                    "source_type": str(source_type).strip(),
+                    "source_type": source_type,
+                    "source_canonical_type": canonicalize_entity_type(source_type),
                     "target": str(target).strip(),
-                    "target_type": str(target_type).strip(),
+                    "target_type": target_type,
+                    "target_canonical_type": canonicalize_entity_type(target_type),
                     "relation": str(rel_name).strip(),
                     "fact": str(r.get("fact") or "").strip(),
                     "attributes": r.get("attributes") or {},
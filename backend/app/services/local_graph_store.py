@@ -10,14 +10,22 @@ from __future__ import annotations
 import json
 import hashlib
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from neo4j import GraphDatabase, Driver
+from neo4j import GraphDatabase, Driver, Record, RoutingControl
 
 from ..config import Config
 from ..utils.logger import get_logger
+from .entity_type_normalizer import canonicalize_entity_type
+from .zep_entity_reader import EntityNode
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 logger = get_logger("mirofish.local_graph_store")
 
@@ -26,27 +34,229 @@ def _now_iso() -> str:
     return datetime.now().isoformat()
 
 
-def _stable_entity_uuid(project_id: str, entity_type: str, name: str) -> str:
+@lru_cache(maxsize=100_000)
+def stable_entity_uuid(project_id: str, entity_type: str, name: str) -> str:
     normalized = (name or "").strip().lower()
     base = f"{project_id}:{entity_type}:{normalized}".encode("utf-8")
-    digest = hashlib.sha1(base).hexdigest()[:16]
+    digest = hashlib.blake2b(base, digest_size=8).hexdigest()
     return f"ent_{digest}"
 
 
-@dataclass(frozen=True)
-class LocalEntity:
-    project_id: str
-    graph_id: str
-    name: str
-    entity_type: str
-    summary: str = ""
-    attributes: Optional[Dict[str, Any]] = None
-    source_entity_types: Optional[List[str]] = None
-    created_at: Optional[str] = None
+if orjson is not None:
+    # orjson is stricter than json (no ints wider than 64 bits, no NaN/Infinity on input),
+    # so anything it rejects goes through the stdlib instead of failing the write/read.
+    def dumps_json(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj, ensure_ascii=False)
+
+    def _loads(s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return json.loads(s)
+else:
+    def dumps_json(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _loads = json.loads
+
+
+def _load_attributes(attributes_json: Optional[str]) -> Dict[str, Any]:
+    try:
+        return _loads(attributes_json or "{}")
+    except Exception:
+        return {}
+
+
+def _node_to_dict(r: Any) -> Dict[str, Any]:
+    """Convert an entity row (record or property map) to the graph_data node shape."""
+    attrs = _load_attributes(r.get("attributes_json"))
+    if isinstance(r.get("source_entity_types"), list):
+        attrs["source_entity_types"] = r.get("source_entity_types")
+    return {
+        "uuid": r.get("uuid"),
+        "name": r.get("name") or "",
+        "labels": ["Entity", r.get("entity_type") or "Entity"],
+        "summary": r.get("summary") or "",
+        "attributes": attrs,
+        "created_at": r.get("created_at"),
+    }
+
+
+def _edge_to_dict(r: Any, source_name: str, target_name: str) -> Dict[str, Any]:
+    """Convert a relation row (record or property map) to the graph_data edge shape."""
+    return {
+        "uuid": r.get("uuid"),
+        "name": r.get("name") or "",
+        "fact": r.get("fact") or "",
+        "fact_type": r.get("fact_type") or (r.get("name") or ""),
+        "source_node_uuid": r.get("source_uuid"),
+        "target_node_uuid": r.get("target_uuid"),
+        "source_node_name": source_name,
+        "target_node_name": target_name,
+        "attributes": _load_attributes(r.get("attributes_json")),
+        "created_at": r.get("created_at"),
+        "valid_at": None,
+        "invalid_at": None,
+        "expired_at": None,
+        "episodes": [],
+    }
+
+
+# Cypher used by LocalNeo4jGraphStore, kept as module constants so hot paths don't rebuild them.
+_SCHEMA_STATEMENTS = (
+    # Graph meta
+    "CREATE CONSTRAINT graph_id_unique IF NOT EXISTS FOR (g:Graph) REQUIRE g.graph_id IS UNIQUE",
+    # Entity uniqueness within a project+type+name key (uuid is deterministic)
+    "CREATE CONSTRAINT entity_uuid_unique IF NOT EXISTS FOR (e:Entity) REQUIRE e.uuid IS UNIQUE",
+    "CREATE INDEX entity_graph_id IF NOT EXISTS FOR (e:Entity) ON (e.graph_id)",
+    "CREATE INDEX entity_project_id IF NOT EXISTS FOR (e:Entity) ON (e.project_id)",
+    "CREATE INDEX relation_graph_id IF NOT EXISTS FOR ()-[r:REL]-() ON (r.graph_id)",
+    "CREATE INDEX chunk_graph_id IF NOT EXISTS FOR (c:Chunk) ON (c.graph_id)",
+    # Composite indexes for the hot (key, graph_id) match patterns
+    "CREATE INDEX entity_uuid_graph IF NOT EXISTS FOR (e:Entity) ON (e.uuid, e.graph_id)",
+    "CREATE INDEX chunk_chunk_id IF NOT EXISTS FOR (c:Chunk) ON (c.chunk_id)",
+    "CREATE INDEX chunk_chunkid_graph IF NOT EXISTS FOR (c:Chunk) ON (c.chunk_id, c.graph_id)",
+    "CREATE INDEX rel_uuid_graph IF NOT EXISTS FOR ()-[r:REL]-() ON (r.uuid, r.graph_id)",
+    "CREATE INDEX entity_name_graph IF NOT EXISTS FOR (e:Entity) ON (e.name, e.graph_id)",
+    "CREATE INDEX entity_type_graph IF NOT EXISTS FOR (e:Entity) ON (e.entity_type, e.graph_id)",
+)
+
+# Label-scoped batched deletes run by delete_graph(), REL edges first.
+_CY_DELETE_GRAPH_BATCHES = (
+    "MATCH ()-[r:REL {graph_id: $graph_id}]->() CALL { WITH r DELETE r } IN TRANSACTIONS OF 10000 ROWS",
+    "MATCH (c:Chunk {graph_id: $graph_id}) CALL { WITH c DETACH DELETE c } IN TRANSACTIONS OF 10000 ROWS",
+    "MATCH (e:Entity {graph_id: $graph_id}) CALL { WITH e DETACH DELETE e } IN TRANSACTIONS OF 10000 ROWS",
+)
+
+_CY_UPSERT_ENTITIES = """
+    UNWIND $rows AS row
+    MERGE (e:Entity {uuid: row.uuid})
+    SET e.project_id = row.project_id,
+        e.graph_id = row.graph_id,
+        e.name = row.name,
+        e.entity_type = row.entity_type,
+        e.summary = CASE
+            WHEN row.summary IS NULL OR row.summary = "" THEN e.summary
+            ELSE row.summary
+        END,
+        e.attributes_json = CASE
+            WHEN row.attributes_json IS NULL OR row.attributes_json = "{}" THEN e.attributes_json
+            ELSE row.attributes_json
+        END,
+        e.source_entity_types = CASE
+            WHEN e.source_entity_types IS NULL THEN row.source_entity_types
+            ELSE e.source_entity_types + [t IN row.source_entity_types WHERE NOT t IN e.source_entity_types]
+        END,
+        e.created_at = COALESCE(e.created_at, row.created_at)
+"""
+
+# Chunks are written even if the Graph node is missing; the Graph is then resolved once per batch.
+_CY_UPSERT_CHUNKS = """
+    UNWIND $rows AS row
+    MERGE (c:Chunk {chunk_id: row.chunk_id})
+    SET c.project_id = $project_id,
+        c.graph_id = $graph_id,
+        c.text = row.text,
+        c.created_at = COALESCE(c.created_at, $created_at)
+    WITH collect(c) AS chunks
+    MATCH (g:Graph {graph_id: $graph_id})
+    UNWIND chunks AS c
+    MERGE (g)-[:HAS_CHUNK]->(c)
+"""
+
+_CY_LINK_MENTIONS = """
+    UNWIND $rows AS row
+    MATCH (c:Chunk {chunk_id: row.chunk_id, graph_id: $graph_id})
+    UNWIND row.entity_uuids AS uuid
+    MATCH (e:Entity {uuid: uuid, graph_id: $graph_id})
+    MERGE (c)-[:MENTIONS]->(e)
+"""
+
+_CY_UPSERT_RELATIONS = """
+    UNWIND $rows AS row
+    MATCH (s:Entity {uuid: row.source_uuid, graph_id: row.graph_id})
+    MATCH (t:Entity {uuid: row.target_uuid, graph_id: row.graph_id})
+    MERGE (s)-[r:REL {uuid: row.uuid}]->(t)
+    SET r.project_id = row.project_id,
+        r.graph_id = row.graph_id,
+        r.name = row.relation_name,
+        r.fact = row.fact,
+        r.fact_type = row.relation_name,
+        r.attributes_json = row.attributes_json,
+        r.created_at = COALESCE(r.created_at, row.created_at)
+"""
 
-    @property
-    def uuid(self) -> str:
-        return _stable_entity_uuid(self.project_id, self.entity_type, self.name)
+_CY_GRAPH_DATA = """
+    CALL {
+        MATCH (e:Entity {graph_id: $graph_id})
+        RETURN collect(e {
+            .uuid, .name, .entity_type, .summary, .attributes_json,
+            .source_entity_types, .created_at
+        }) AS nodes
+    }
+    CALL {
+        MATCH (s:Entity {graph_id: $graph_id})-[r:REL {graph_id: $graph_id}]->(t:Entity {graph_id: $graph_id})
+        RETURN collect(r {
+            .uuid, .name, .fact, .fact_type, .attributes_json, .created_at,
+            source_uuid: s.uuid, target_uuid: t.uuid,
+            source_name: s.name, target_name: t.name
+        }) AS edges
+    }
+    RETURN nodes, edges
+"""
+
+
+# get_entity_graph(): nodes as positional lists, edges as map projections with endpoint names, one round trip.
+_CY_ENTITY_GRAPH = """
+    CALL {
+        MATCH (e:Entity {graph_id: $graph_id})
+        RETURN collect([e.uuid, e.name, e.entity_type, e.summary, e.attributes_json, e.source_entity_types]) AS nodes
+    }
+    CALL {
+        MATCH (s:Entity {graph_id: $graph_id})-[r:REL {graph_id: $graph_id}]->(t:Entity {graph_id: $graph_id})
+        RETURN collect(r {
+            .uuid, .name, .fact, .fact_type, .attributes_json, .created_at,
+            source_uuid: s.uuid, target_uuid: t.uuid,
+            source_name: s.name, target_name: t.name
+        }) AS edges
+    }
+    RETURN nodes, edges
+"""
+
+
+# Entity plus its 1-hop REL edges and neighbor entities; expects `e` bound by the preceding MATCH.
+_NEIGHBORS_RETURN = """
+    OPTIONAL MATCH (e)-[r:REL {graph_id: $graph_id}]-(m:Entity {graph_id: $graph_id})
+    RETURN e {.*} AS node,
+           collect(DISTINCT r {
+               .*,
+               source_uuid: startNode(r).uuid,
+               target_uuid: endNode(r).uuid,
+               source_name: startNode(r).name,
+               target_name: endNode(r).name
+           }) AS edges,
+           // Same 4-key shape as LocalEntityReader._enrich(); a self-loop lists the entity itself
+           collect(DISTINCT m {
+               .uuid,
+               name: coalesce(m.name, ""),
+               labels: ["Entity", CASE WHEN coalesce(m.entity_type, "") = "" THEN "Entity" ELSE m.entity_type END],
+               summary: coalesce(m.summary, "")
+           }) AS neighbors
+"""
+
+
+def _neighbors_to_dict(record: Any) -> Dict[str, Any]:
+    return {
+        "node": _node_to_dict(record["node"]),
+        "edges": [
+            _edge_to_dict(r, source_name=r.get("source_name") or "", target_name=r.get("target_name") or "")
+            for r in record["edges"]
+        ],
+        "neighbors": [dict(m) for m in record["neighbors"]],
+    }
 
 
 @dataclass(frozen=True)
@@ -60,6 +270,10 @@ class LocalRelation:
     attributes: Optional[Dict[str, Any]] = None
     created_at: Optional[str] = None
     uuid: str = ""
+    attributes_json: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "attributes_json", dumps_json(self.attributes or {}))
 
 
 class LocalNeo4jGraphStore:
@@ -67,6 +281,9 @@ class LocalNeo4jGraphStore:
         self._driver: Driver = GraphDatabase.driver(
             Config.NEO4J_URI,
             auth=(Config.NEO4J_USER, Config.NEO4J_PASSWORD),
+            max_connection_pool_size=Config.NEO4J_MAX_CONNECTION_POOL_SIZE,
+            connection_acquisition_timeout=Config.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+            max_transaction_retry_time=Config.NEO4J_MAX_TRANSACTION_RETRY_TIME,
         )
         self._database = Config.NEO4J_DATABASE
         self._ensure_schema()
@@ -77,245 +294,141 @@ class LocalNeo4jGraphStore:
         except Exception:
             pass
 
-    def _ensure_schema(self) -> None:
-        statements = [
-            # Graph meta
-            "CREATE CONSTRAINT graph_id_unique IF NOT EXISTS FOR (g:Graph) REQUIRE g.graph_id IS UNIQUE",
-            # Entity uniqueness within a project+type+name key (uuid is deterministic)
-            "CREATE CONSTRAINT entity_uuid_unique IF NOT EXISTS FOR (e:Entity) REQUIRE e.uuid IS UNIQUE",
-            "CREATE INDEX entity_graph_id IF NOT EXISTS FOR (e:Entity) ON (e.graph_id)",
-            "CREATE INDEX entity_project_id IF NOT EXISTS FOR (e:Entity) ON (e.project_id)",
-            "CREATE INDEX relation_graph_id IF NOT EXISTS FOR ()-[r:REL]-() ON (r.graph_id)",
-            "CREATE INDEX chunk_graph_id IF NOT EXISTS FOR (c:Chunk) ON (c.graph_id)",
-        ]
+    def _exec(self, cypher: str, routing: RoutingControl = RoutingControl.WRITE, **params: Any) -> List[Record]:
+        """
+        Run one query in a driver-managed (retried) transaction against the pinned database.
+
+        Pinning database_ skips the home-database lookup round trip on every call.
+        """
+        records, _, _ = self._driver.execute_query(
+            cypher,
+            parameters_=params,
+            database_=self._database,
+            routing_=routing,
+        )
+        return records
 
-        with self._driver.session(database=self._database) as session:
-            for cypher in statements:
-                try:
-                    session.run(cypher)
-                except Exception as e:
-                    # Neo4j versions vary; log and continue to avoid hard failure.
-                    logger.warning(f"Neo4j schema statement failed: {cypher} err={str(e)[:120]}")
+    def _ensure_schema(self) -> None:
+        for cypher in _SCHEMA_STATEMENTS:
+            try:
+                self._exec(cypher)
+            except Exception as e:
+                # Neo4j versions vary; log and continue to avoid hard failure.
+                logger.warning(f"Neo4j schema statement failed: {cypher} err={str(e)[:120]}")
 
     def create_graph(self, project_id: str, name: str, ontology: Optional[Dict[str, Any]] = None) -> str:
         graph_id = f"mirofish_local_{uuid.uuid4().hex[:16]}"
         created_at = _now_iso()
-        ontology_json = json.dumps(ontology or {}, ensure_ascii=False)
-
-        with self._driver.session(database=self._database) as session:
-            session.run(
-                """
-                CREATE (g:Graph {
-                    graph_id: $graph_id,
-                    project_id: $project_id,
-                    name: $name,
-                    ontology_json: $ontology_json,
-                    created_at: $created_at
-                })
-                """,
-                graph_id=graph_id,
-                project_id=project_id,
-                name=name,
-                ontology_json=ontology_json,
-                created_at=created_at,
-            )
+        ontology_json = dumps_json(ontology or {})
+
+        self._exec(
+            """
+            CREATE (g:Graph {
+                graph_id: $graph_id,
+                project_id: $project_id,
+                name: $name,
+                ontology_json: $ontology_json,
+                created_at: $created_at
+            })
+            """,
+            graph_id=graph_id,
+            project_id=project_id,
+            name=name,
+            ontology_json=ontology_json,
+            created_at=created_at,
+        )
 
         return graph_id
 
     def delete_graph(self, graph_id: str) -> None:
+        # Delete label by label in bounded batches instead of one OPTIONAL MATCH chain, which
+        # expands into a cartesian row set and a single huge transaction on large graphs.
+        # CALL ... IN TRANSACTIONS is only allowed in auto-commit transactions, so these go
+        # through session.run rather than the managed execute_query helper.
         with self._driver.session(database=self._database) as session:
-            session.run(
-                """
-                MATCH (g:Graph {graph_id: $graph_id})
-                OPTIONAL MATCH (g)-[:HAS_CHUNK]->(c:Chunk)
-                OPTIONAL MATCH (c)-[m:MENTIONS]->(e:Entity)
-                OPTIONAL MATCH (e)-[r:REL]->(e2:Entity)
-                DETACH DELETE g, c, e, e2
-                """,
-                graph_id=graph_id,
-            )
-            # In case there are entities not linked to graph meta (older runs)
-            session.run("MATCH (e:Entity {graph_id:$graph_id}) DETACH DELETE e", graph_id=graph_id)
-            session.run("MATCH (c:Chunk {graph_id:$graph_id}) DETACH DELETE c", graph_id=graph_id)
-
-    def upsert_entities(self, entities: Iterable[LocalEntity]) -> List[str]:
-        uuids: List[str] = []
-        with self._driver.session(database=self._database) as session:
-            for ent in entities:
-                uuids.append(ent.uuid)
-                session.run(
-                    """
-                    MERGE (e:Entity {uuid: $uuid})
-                    SET e.project_id = $project_id,
-                        e.graph_id = $graph_id,
-                        e.name = $name,
-                        e.entity_type = $entity_type,
-                        e.summary = CASE
-                            WHEN $summary IS NULL OR $summary = "" THEN e.summary
-                            ELSE $summary
-                        END,
-                        e.attributes_json = CASE
-                            WHEN $attributes_json IS NULL OR $attributes_json = "{}" THEN e.attributes_json
-                            ELSE $attributes_json
-                        END,
-                        e.source_entity_types = CASE
-                            WHEN e.source_entity_types IS NULL THEN $source_entity_types
-                            ELSE e.source_entity_types + [t IN $source_entity_types WHERE NOT t IN e.source_entity_types]
-                        END,
-                        e.created_at = COALESCE(e.created_at, $created_at)
-                    """,
-                    uuid=ent.uuid,
-                    project_id=ent.project_id,
-                    graph_id=ent.graph_id,
-                    name=ent.name,
-                    entity_type=ent.entity_type,
-                    summary=ent.summary or "",
-                    attributes_json=json.dumps(ent.attributes or {}, ensure_ascii=False),
-                    source_entity_types=list(dict.fromkeys([t for t in (ent.source_entity_types or []) if t])),
-                    created_at=ent.created_at or _now_iso(),
-                )
-        return uuids
+            for cypher in _CY_DELETE_GRAPH_BATCHES:
+                session.run(cypher, graph_id=graph_id).consume()
+        self._exec("MATCH (g:Graph {graph_id: $graph_id}) DETACH DELETE g", graph_id=graph_id)
+
+    def upsert_entities_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Upsert entities from plain row dicts in a single UNWIND statement and one transaction.
+
+        Each row carries: uuid, project_id, graph_id, name, entity_type, summary,
+        attributes_json, source_entity_types, created_at.
+        """
+        if not rows:
+            return
+        self._exec(
+            _CY_UPSERT_ENTITIES,
+            rows=rows,
+        )
 
-    def upsert_chunk(self, project_id: str, graph_id: str, chunk_id: str, text: str) -> None:
-        with self._driver.session(database=self._database) as session:
-            session.run(
-                """
-                MERGE (c:Chunk {chunk_id: $chunk_id})
-                SET c.project_id = $project_id,
-                    c.graph_id = $graph_id,
-                    c.text = $text,
-                    c.created_at = COALESCE(c.created_at, $created_at)
-                WITH c
-                MATCH (g:Graph {graph_id: $graph_id})
-                MERGE (g)-[:HAS_CHUNK]->(c)
-                """,
-                chunk_id=chunk_id,
-                project_id=project_id,
-                graph_id=graph_id,
-                text=text,
-                created_at=_now_iso(),
-            )
+    def upsert_chunks_bulk(self, project_id: str, graph_id: str, chunks: Iterable[Tuple[str, str]]) -> None:
+        """Upsert many (chunk_id, text) pairs in a single UNWIND statement."""
+        rows = [{"chunk_id": chunk_id, "text": text} for chunk_id, text in chunks]
+        if not rows:
+            return
+        self._exec(
+            _CY_UPSERT_CHUNKS,
+            rows=rows,
+            project_id=project_id,
+            graph_id=graph_id,
+            created_at=_now_iso(),
+        )
 
-    def link_mentions(self, chunk_id: str, entity_uuids: Iterable[str], graph_id: str) -> None:
-        entity_uuids = list(entity_uuids)
-        if not entity_uuids:
+    def link_mentions_bulk(self, graph_id: str, mentions: Iterable[Tuple[str, Iterable[str]]]) -> None:
+        """Link many (chunk_id, entity_uuids) pairs in a single UNWIND statement."""
+        rows: List[Dict[str, Any]] = []
+        for chunk_id, entity_uuids in mentions:
+            entity_uuids = list(entity_uuids)
+            if entity_uuids:
+                rows.append({"chunk_id": chunk_id, "entity_uuids": entity_uuids})
+        if not rows:
             return
-        with self._driver.session(database=self._database) as session:
-            session.run(
-                """
-                MATCH (c:Chunk {chunk_id: $chunk_id, graph_id: $graph_id})
-                UNWIND $entity_uuids AS uuid
-                MATCH (e:Entity {uuid: uuid, graph_id: $graph_id})
-                MERGE (c)-[:MENTIONS]->(e)
-                """,
-                chunk_id=chunk_id,
-                graph_id=graph_id,
-                entity_uuids=entity_uuids,
-            )
+        self._exec(
+            _CY_LINK_MENTIONS,
+            graph_id=graph_id,
+            rows=rows,
+        )
 
     def upsert_relations(self, relations: Iterable[LocalRelation]) -> None:
-        with self._driver.session(database=self._database) as session:
-            for rel in relations:
-                rel_uuid = rel.uuid or f"rel_{uuid.uuid4().hex[:16]}"
-                session.run(
-                    """
-                    MATCH (s:Entity {uuid: $source_uuid, graph_id: $graph_id})
-                    MATCH (t:Entity {uuid: $target_uuid, graph_id: $graph_id})
-                    MERGE (s)-[r:REL {uuid: $uuid}]->(t)
-                    SET r.project_id = $project_id,
-                        r.graph_id = $graph_id,
-                        r.name = $relation_name,
-                        r.fact = $fact,
-                        r.fact_type = $relation_name,
-                        r.attributes_json = $attributes_json,
-                        r.created_at = COALESCE(r.created_at, $created_at)
-                    """,
-                    uuid=rel_uuid,
-                    project_id=rel.project_id,
-                    graph_id=rel.graph_id,
-                    source_uuid=rel.source_uuid,
-                    target_uuid=rel.target_uuid,
-                    relation_name=rel.relation_name,
-                    fact=rel.fact or "",
-                    attributes_json=json.dumps(rel.attributes or {}, ensure_ascii=False),
-                    created_at=rel.created_at or _now_iso(),
-                )
+        batch_now = _now_iso()
+        rows = [
+            {
+                "uuid": rel.uuid or f"rel_{uuid.uuid4().hex[:16]}",
+                "project_id": rel.project_id,
+                "graph_id": rel.graph_id,
+                "source_uuid": rel.source_uuid,
+                "target_uuid": rel.target_uuid,
+                "relation_name": rel.relation_name,
+                "fact": rel.fact or "",
+                "attributes_json": rel.attributes_json,
+                "created_at": rel.created_at or batch_now,
+            }
+            for rel in relations
+        ]
+        if not rows:
+            return
+        self._exec(
+            _CY_UPSERT_RELATIONS,
+            rows=rows,
+        )
 
     def get_graph_data(self, graph_id: str) -> Dict[str, Any]:
-        with self._driver.session(database=self._database) as session:
-            node_records = session.run(
-                """
-                MATCH (e:Entity {graph_id: $graph_id})
-                RETURN e.uuid AS uuid, e.name AS name, e.entity_type AS entity_type,
-                       e.summary AS summary, e.attributes_json AS attributes_json,
-                       e.source_entity_types AS source_entity_types,
-                       e.created_at AS created_at
-                """,
-                graph_id=graph_id,
-            )
-
-            nodes: List[Dict[str, Any]] = []
-            node_name_map: Dict[str, str] = {}
-            for r in node_records:
-                attrs = {}
-                try:
-                    attrs = json.loads(r.get("attributes_json") or "{}")
-                except Exception:
-                    attrs = {}
-                if isinstance(r.get("source_entity_types"), list):
-                    attrs["source_entity_types"] = r.get("source_entity_types")
-                uuid_ = r.get("uuid")
-                name = r.get("name") or ""
-                node_name_map[uuid_] = name
-                entity_type = r.get("entity_type") or "Entity"
-                nodes.append(
-                    {
-                        "uuid": uuid_,
-                        "name": name,
-                        "labels": ["Entity", entity_type],
-                        "summary": r.get("summary") or "",
-                        "attributes": attrs,
-                        "created_at": r.get("created_at"),
-                    }
-                )
-
-            edge_records = session.run(
-                """
-                MATCH (s:Entity {graph_id: $graph_id})-[r:REL {graph_id: $graph_id}]->(t:Entity {graph_id: $graph_id})
-                RETURN r.uuid AS uuid, r.name AS name, r.fact AS fact, r.fact_type AS fact_type,
-                       r.attributes_json AS attributes_json, r.created_at AS created_at,
-                       s.uuid AS source_uuid, t.uuid AS target_uuid
-                """,
-                graph_id=graph_id,
-            )
+        # Nodes and edges come back in one round trip; endpoint names are resolved in Cypher.
+        records = self._exec(
+            _CY_GRAPH_DATA,
+            routing=RoutingControl.READ,
+            graph_id=graph_id,
+        )
+        record = records[0] if records else {"nodes": [], "edges": []}
 
-            edges: List[Dict[str, Any]] = []
-            for r in edge_records:
-                attrs = {}
-                try:
-                    attrs = json.loads(r.get("attributes_json") or "{}")
-                except Exception:
-                    attrs = {}
-                source_uuid = r.get("source_uuid")
-                target_uuid = r.get("target_uuid")
-                edges.append(
-                    {
-                        "uuid": r.get("uuid"),
-                        "name": r.get("name") or "",
-                        "fact": r.get("fact") or "",
-                        "fact_type": r.get("fact_type") or (r.get("name") or ""),
-                        "source_node_uuid": source_uuid,
-                        "target_node_uuid": target_uuid,
-                        "source_node_name": node_name_map.get(source_uuid, ""),
-                        "target_node_name": node_name_map.get(target_uuid, ""),
-                        "attributes": attrs,
-                        "created_at": r.get("created_at"),
-                        "valid_at": None,
-                        "invalid_at": None,
-                        "expired_at": None,
-                        "episodes": [],
-                    }
-                )
+        nodes: List[Dict[str, Any]] = [_node_to_dict(n) for n in record["nodes"]]
+        edges: List[Dict[str, Any]] = [
+            _edge_to_dict(r, source_name=r.get("source_name") or "", target_name=r.get("target_name") or "")
+            for r in record["edges"]
+        ]
 
         return {
             "graph_id": graph_id,
@@ -324,3 +437,255 @@ class LocalNeo4jGraphStore:
             "node_count": len(nodes),
             "edge_count": len(edges),
         }
+
+    def get_graph_columns(self, graph_id: str, decode_attributes: bool = True) -> Dict[str, Dict[str, List[Any]]]:
+        """
+        Graph nodes and edges in columnar layout: {"nodes": {field: [...]}, "edges": {field: [...]}}.
+
+        For in-process consumers that read a few fields across all rows; field names and defaults
+        follow get_graph_data(), but no per-row dict is built. Rows are collected as lists
+        (collect() would drop nulls from a bare property and misalign the columns).
+
+        With decode_attributes=False the attributes JSON is neither fetched nor parsed and the
+        nodes "attributes" column is omitted.
+        """
+        records = self._exec(
+            """
+            CALL {
+                MATCH (e:Entity {graph_id: $graph_id})
+                RETURN collect([e.uuid, e.name, e.entity_type, e.summary,
+                                CASE WHEN $decode_attributes THEN e.attributes_json END,
+                                e.source_entity_types]) AS nodes
+            }
+            CALL {
+                MATCH (s:Entity {graph_id: $graph_id})-[r:REL {graph_id: $graph_id}]->(t:Entity {graph_id: $graph_id})
+                RETURN collect([r.uuid, r.name, r.fact, s.uuid, t.uuid, s.name, t.name, r.created_at]) AS edges
+            }
+            RETURN nodes, edges
+            """,
+            routing=RoutingControl.READ,
+            graph_id=graph_id,
+            decode_attributes=decode_attributes,
+        )
+        node_rows = records[0]["nodes"] if records else []
+        edge_rows = records[0]["edges"] if records else []
+
+        uuids, names, types, summaries, attributes_json, source_types = (
+            zip(*node_rows) if node_rows else ((),) * 6
+        )
+        attributes = []
+        if decode_attributes:
+            for raw, sources in zip(attributes_json, source_types):
+                attrs = _load_attributes(raw)
+                if isinstance(sources, list):
+                    attrs["source_entity_types"] = sources
+                attributes.append(attrs)
+
+        (
+            edge_uuids, edge_names, facts, source_uuids, target_uuids,
+            source_names, target_names, created_ats,
+        ) = zip(*edge_rows) if edge_rows else ((),) * 8
+
+        node_columns: Dict[str, List[Any]] = {
+            "uuid": list(uuids),
+            "name": [n or "" for n in names],
+            "labels": [["Entity", t or "Entity"] for t in types],
+            "summary": [s or "" for s in summaries],
+        }
+        if decode_attributes:
+            node_columns["attributes"] = attributes
+
+        return {
+            "nodes": node_columns,
+            "edges": {
+                "uuid": list(edge_uuids),
+                "name": [n or "" for n in edge_names],
+                "fact": [f or "" for f in facts],
+                "source_node_uuid": list(source_uuids),
+                "target_node_uuid": list(target_uuids),
+                "source_node_name": [n or "" for n in source_names],
+                "target_node_name": [n or "" for n in target_names],
+                "created_at": list(created_ats),
+            },
+        }
+
+    def get_counts(self, graph_id: str) -> Dict[str, int]:
+        """Node and edge counts for a graph without materializing either collection."""
+        records = self._exec(
+            """
+            CALL { MATCH (e:Entity {graph_id: $graph_id}) RETURN count(e) AS node_count }
+            CALL {
+                // Same endpoint scoping as get_graph_data, so counts match the graph actually served
+                MATCH (:Entity {graph_id: $graph_id})-[r:REL {graph_id: $graph_id}]->(:Entity {graph_id: $graph_id})
+                RETURN count(r) AS edge_count
+            }
+            RETURN node_count, edge_count
+            """,
+            routing=RoutingControl.READ,
+            graph_id=graph_id,
+        )
+        if not records:
+            return {"node_count": 0, "edge_count": 0}
+        return {"node_count": records[0]["node_count"], "edge_count": records[0]["edge_count"]}
+
+    def get_top_nodes(self, graph_id: str, limit: int) -> List[Dict[str, Any]]:
+        """First `limit` entities of a graph in the graph_data node shape, limited in Cypher."""
+        records = self._exec(
+            """
+            MATCH (e:Entity {graph_id: $graph_id})
+            RETURN e {
+                .uuid, .name, .entity_type, .summary, .attributes_json,
+                .source_entity_types, .created_at
+            } AS node
+            LIMIT $limit
+            """,
+            routing=RoutingControl.READ,
+            graph_id=graph_id,
+            limit=int(limit),
+        )
+        return [_node_to_dict(r["node"]) for r in records]
+
+    def get_top_edges(self, graph_id: str, limit: int) -> List[Dict[str, Any]]:
+        """First `limit` REL edges of a graph in the graph_data edge shape, limited in Cypher."""
+        records = self._exec(
+            """
+            MATCH (s:Entity {graph_id: $graph_id})-[r:REL {graph_id: $graph_id}]->(t:Entity {graph_id: $graph_id})
+            RETURN r {
+                .uuid, .name, .fact, .fact_type, .attributes_json, .created_at,
+                source_uuid: s.uuid, target_uuid: t.uuid,
+                source_name: s.name, target_name: t.name
+            } AS edge
+            LIMIT $limit
+            """,
+            routing=RoutingControl.READ,
+            graph_id=graph_id,
+            limit=int(limit),
+        )
+        return [
+            _edge_to_dict(e, source_name=e.get("source_name") or "", target_name=e.get("target_name") or "")
+            for e in (r["edge"] for r in records)
+        ]
+
+    def get_entity_graph(self, graph_id: str) -> Tuple[List[EntityNode], List[Dict[str, Any]]]:
+        """
+        Entities as EntityNode objects (related_* left empty) plus edges in the graph_data shape.
+
+        Used by the entity reader, which only needs attribute access on nodes; nodes and edges
+        come back in one round trip and node rows are unpacked positionally.
+        """
+        records = self._exec(
+            _CY_ENTITY_GRAPH,
+            routing=RoutingControl.READ,
+            graph_id=graph_id,
+        )
+        record = records[0] if records else {"nodes": [], "edges": []}
+
+        nodes: List[EntityNode] = []
+        for uuid_, name, entity_type, summary, attributes_json, source_entity_types in record["nodes"]:
+            attrs = _load_attributes(attributes_json)
+            if isinstance(source_entity_types, list):
+                attrs["source_entity_types"] = source_entity_types
+            nodes.append(
+                EntityNode(
+                    uuid=uuid_ or "",
+                    name=name or "",
+                    labels=["Entity", entity_type or "Entity"],
+                    summary=summary or "",
+                    attributes=attrs,
+                )
+            )
+
+        edges = [
+            _edge_to_dict(e, source_name=e.get("source_name") or "", target_name=e.get("target_name") or "")
+            for e in record["edges"]
+        ]
+
+        return nodes, edges
+
+    def find_entity(self, graph_id: str, name: str) -> Optional[Dict[str, Any]]:
+        """Look up one entity by exact name (index seek on name+graph_id); None if absent."""
+        records = self._exec(
+            """
+            MATCH (e:Entity {graph_id: $graph_id, name: $name})
+            RETURN e {
+                .uuid, .name, .entity_type, .summary, .attributes_json,
+                .source_entity_types, .created_at
+            } AS node
+            LIMIT 1
+            """,
+            routing=RoutingControl.READ,
+            graph_id=graph_id,
+            name=name,
+        )
+        if not records:
+            return None
+        return _node_to_dict(records[0]["node"])
+
+    def get_node_with_neighbors(self, graph_id: str, entity_uuid: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single entity with its REL edges and 1-hop neighbors in one query.
+
+        Returns {"node": {...}, "edges": [...], "neighbors": [...]}, or None if not found.
+        Neighbors are {uuid, name, labels, summary} dicts.
+        """
+        records = self._exec(
+            "MATCH (e:Entity {uuid: $uuid, graph_id: $graph_id})" + _NEIGHBORS_RETURN,
+            routing=RoutingControl.READ,
+            uuid=entity_uuid,
+            graph_id=graph_id,
+        )
+        if not records:
+            return None
+        return _neighbors_to_dict(records[0])
+
+    def get_nodes_by_type(
+        self,
+        graph_id: str,
+        entity_types: List[str],
+        with_neighbors: bool = False,
+        exact: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch entities whose canonical type, or any recorded source type, is in entity_types.
+
+        With exact=True only the stored entity_type is compared, as given (index-backed).
+        Each item has the same shape as get_node_with_neighbors(); edges/neighbors are empty
+        when with_neighbors is False.
+        """
+        if exact:
+            canonical_types = list(entity_types)
+            match = """
+                MATCH (e:Entity {graph_id: $graph_id})
+                WHERE e.entity_type IN $canonical_types
+            """
+        else:
+            canonical_types = list({canonicalize_entity_type(t) for t in entity_types})
+            match = """
+                MATCH (e:Entity {graph_id: $graph_id})
+                WHERE e.entity_type IN $canonical_types
+                   OR any(t IN coalesce(e.source_entity_types, []) WHERE t IN $entity_types)
+            """
+        if with_neighbors:
+            records = self._exec(
+                match + _NEIGHBORS_RETURN,
+                routing=RoutingControl.READ,
+                graph_id=graph_id,
+                canonical_types=canonical_types,
+                entity_types=list(entity_types),
+            )
+            return [_neighbors_to_dict(r) for r in records]
+
+        records = self._exec(
+            match + "RETURN e {.*} AS node",
+            routing=RoutingControl.READ,
+            graph_id=graph_id,
+            canonical_types=canonical_types,
+            entity_types=list(entity_types),
+        )
+        return [{"node": _node_to_dict(r["node"]), "edges": [], "neighbors": []} for r in records]
+
+
+@lru_cache(maxsize=1)
+def get_local_graph_store() -> LocalNeo4jGraphStore:
+    """Process-wide store so every service shares one Neo4j driver/connection pool."""
+    return LocalNeo4jGraphStore()
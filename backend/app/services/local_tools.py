@@ -10,12 +10,21 @@ The return types reuse dataclasses from zep_tools.py for compatibility.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import csv
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import Config
 from ..utils.logger import get_logger
-from .local_graph_store import LocalNeo4jGraphStore
-from .local_vector_store import QdrantChunkStore
+from .local_graph_store import get_local_graph_store
+from .local_vector_store import QdrantChunkStore, get_qdrant_chunk_store
 from .zep_tools import (
     InsightForgeResult,
     PanoramaResult,
@@ -28,17 +37,178 @@ from .zep_tools import (
 
 logger = get_logger("mirofish.local_tools")
 
+# Shared pool for overlapping independent Neo4j/Qdrant calls within a single tool call.
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="local-tools-io")
+
+# How long a materialized graph (NodeInfo/EdgeInfo lists) is reused before re-reading Neo4j.
+_GRAPH_CACHE_TTL_SECONDS = 60.0
+# Node/edge counts change only while a graph is being built; reuse them briefly.
+_STATS_CACHE_TTL_SECONDS = 30.0
+# Upper bounds on cached graphs / count entries; least recently used is evicted first.
+_GRAPH_CACHE_MAX_ENTRIES = 8
+_STATS_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass
+class _MaterializedGraph:
+    nodes: List[NodeInfo]
+    edges: List[EdgeInfo]
+    edge_facts: List[str]
+    # stripped entity name -> index into nodes (first occurrence wins)
+    name_index: Dict[str, int]
+    # display type per node (first custom label, "实体" when there is none)
+    entity_types: List[str]
+    loaded_at: float
+
+
+@lru_cache(maxsize=32)
+def _read_reddit_profiles(path: str, mtime: float) -> Tuple[Dict[str, Any], ...]:
+    # mtime is only part of the cache key: rewriting the file invalidates the cached parse.
+    with open(path, "r", encoding="utf-8") as f:
+        profiles = json.load(f)
+    return tuple(profiles) if isinstance(profiles, list) else ()
+
+
+@lru_cache(maxsize=32)
+def _read_twitter_profiles(path: str, mtime: float) -> Tuple[Dict[str, Any], ...]:
+    profiles: List[Dict[str, Any]] = []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Resolve column positions once instead of building a dict per row.
+        columns = [
+            header.index(col) if col in header else -1
+            for col in ("name", "username", "description", "user_char")
+        ]
+        for row in reader:
+            # Blank lines come back as []; DictReader skipped them, so do the same.
+            if not row:
+                continue
+            realname, username, bio, persona = [
+                row[i] if 0 <= i < len(row) else "" for i in columns
+            ]
+            profiles.append(
+                {
+                    "realname": realname,
+                    "username": username,
+                    "bio": bio,
+                    "persona": persona,
+                    "profession": "未知",
+                }
+            )
+    return tuple(profiles)
+
 
 class LocalToolsService:
     def __init__(self):
-        self.graph_store = LocalNeo4jGraphStore()
-        self.vector_store = None
-        if Config.VECTOR_BACKEND == "qdrant":
-            try:
-                self.vector_store = QdrantChunkStore()
-            except Exception as e:
-                logger.warning(f"Qdrant init failed, semantic search disabled: {e}")
-                self.vector_store = None
+        self.graph_store = get_local_graph_store()
+        self.vector_store = None  # lazy init
+        # LRU order, oldest first; both guarded by _graph_cache_lock
+        self._graph_cache: OrderedDict[str, _MaterializedGraph] = OrderedDict()
+        self._graph_cache_lock = threading.Lock()
+        self._stats_cache: OrderedDict[str, Tuple[float, Dict[str, int]]] = OrderedDict()
+        # Bumped by invalidate_graph() so reads started before it are not cached afterwards
+        self._cache_generation = 0
+
+    def _get_vector_store(self) -> Optional[QdrantChunkStore]:
+        # Retried on every call while unavailable, so a transient Qdrant outage at startup
+        # does not disable semantic search for the life of the process.
+        if Config.VECTOR_BACKEND != "qdrant":
+            return None
+        if self.vector_store is not None:
+            return self.vector_store
+        try:
+            self.vector_store = get_qdrant_chunk_store()
+        except Exception as e:
+            logger.warning(f"Qdrant init failed, semantic search disabled: {e}")
+            self.vector_store = None
+        return self.vector_store
+
+    def invalidate_graph(self, graph_id: str) -> None:
+        """Forget cached data for graph_id (called after a build finishes or the graph is deleted)."""
+        with self._graph_cache_lock:
+            self._graph_cache.pop(graph_id, None)
+            self._stats_cache.pop(graph_id, None)
+            self._cache_generation += 1
+
+    def _cached_graph(self, graph_id: str) -> Optional[_MaterializedGraph]:
+        """The cached materialization of graph_id if it is still fresh, else None."""
+        with self._graph_cache_lock:
+            cached = self._graph_cache.get(graph_id)
+            if cached is None:
+                return None
+            if time.monotonic() - cached.loaded_at >= _GRAPH_CACHE_TTL_SECONDS:
+                del self._graph_cache[graph_id]
+                return None
+            self._graph_cache.move_to_end(graph_id)
+            return cached
+
+    def _get_materialized(self, graph_id: str) -> _MaterializedGraph:
+        """
+        All nodes/edges of a graph as NodeInfo/EdgeInfo, built once and reused for
+        _GRAPH_CACHE_TTL_SECONDS so repeated report tool calls skip the conversion.
+        """
+        cached = self._cached_graph(graph_id)
+        if cached is not None:
+            return cached
+
+        generation = self._cache_generation
+        graph = self.graph_store.get_graph_columns(graph_id)
+        nodes = graph["nodes"]
+        edges = graph["edges"]
+
+        node_infos = [
+            NodeInfo(uuid=uuid_ or "", name=name, labels=labels, summary=summary, attributes=attributes)
+            for uuid_, name, labels, summary, attributes in zip(
+                nodes["uuid"], nodes["name"], nodes["labels"], nodes["summary"], nodes["attributes"]
+            )
+        ]
+        edge_infos = [
+            EdgeInfo(
+                uuid=uuid_ or "",
+                name=name,
+                fact=fact,
+                source_node_uuid=source_uuid or "",
+                target_node_uuid=target_uuid or "",
+                source_node_name=source_name,
+                target_node_name=target_name,
+                created_at=created_at,
+                valid_at=None,
+                invalid_at=None,
+                expired_at=None,
+            )
+            for uuid_, name, fact, source_uuid, target_uuid, source_name, target_name, created_at in zip(
+                edges["uuid"],
+                edges["name"],
+                edges["fact"],
+                edges["source_node_uuid"],
+                edges["target_node_uuid"],
+                edges["source_node_name"],
+                edges["target_node_name"],
+                edges["created_at"],
+            )
+        ]
+        name_index: Dict[str, int] = {}
+        for i, name in enumerate(nodes["name"]):
+            name_index.setdefault(name.strip(), i)
+
+        materialized = _MaterializedGraph(
+            nodes=node_infos,
+            edges=edge_infos,
+            edge_facts=[f for f in edges["fact"] if f],
+            name_index=name_index,
+            entity_types=[
+                labels[1] if labels[1] not in ("Entity", "Node") else "实体" for labels in nodes["labels"]
+            ],
+            loaded_at=time.monotonic(),
+        )
+        with self._graph_cache_lock:
+            if generation == self._cache_generation:
+                self._graph_cache[graph_id] = materialized
+                self._graph_cache.move_to_end(graph_id)
+                while len(self._graph_cache) > _GRAPH_CACHE_MAX_ENTRIES:
+                    self._graph_cache.popitem(last=False)
+        return materialized
 
     @staticmethod
     def _load_agent_profiles(simulation_id: str) -> List[Dict[str, Any]]:
@@ -46,39 +216,21 @@ class LocalToolsService:
         Load prepared agent profiles for a simulation.
 
         Mirrors ZepToolsService._load_agent_profiles() but without requiring Zep.
+        Parsed files are cached per (path, mtime), so repeat interviews skip the disk read.
         """
-        import os
-        import csv
-        import json
-
         sim_dir = os.path.join(Config.OASIS_SIMULATION_DATA_DIR, simulation_id)
-        profiles: List[Dict[str, Any]] = []
 
         reddit_profile_path = os.path.join(sim_dir, "reddit_profiles.json")
         if os.path.exists(reddit_profile_path):
             try:
-                with open(reddit_profile_path, "r", encoding="utf-8") as f:
-                    profiles = json.load(f)
-                return profiles if isinstance(profiles, list) else []
+                return list(_read_reddit_profiles(reddit_profile_path, os.path.getmtime(reddit_profile_path)))
             except Exception as e:
                 logger.warning(f"Read reddit_profiles.json failed: {e}")
 
         twitter_profile_path = os.path.join(sim_dir, "twitter_profiles.csv")
         if os.path.exists(twitter_profile_path):
             try:
-                with open(twitter_profile_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        profiles.append(
-                            {
-                                "realname": row.get("name", ""),
-                                "username": row.get("username", ""),
-                                "bio": row.get("description", ""),
-                                "persona": row.get("user_char", ""),
-                                "profession": "未知",
-                            }
-                        )
-                return profiles
+                return list(_read_twitter_profiles(twitter_profile_path, os.path.getmtime(twitter_profile_path)))
             except Exception as e:
                 logger.warning(f"Read twitter_profiles.csv failed: {e}")
 
@@ -156,29 +308,28 @@ class LocalToolsService:
         api_data = api_result.get("result", {})
         results_dict = api_data.get("results", {}) if isinstance(api_data, dict) else {}
 
+        empty: Dict[str, Any] = {}
+        interviews = result.interviews
         for agent_idx in selected_indices:
-            agent = profiles[agent_idx] if agent_idx < len(profiles) else {}
-            agent_name = agent.get("realname", agent.get("username", f"Agent_{agent_idx}"))
-            agent_role = agent.get("profession", "未知")
-            agent_bio = agent.get("bio", "")
-
-            twitter_result = results_dict.get(f"twitter_{agent_idx}", {}) or {}
-            reddit_result = results_dict.get(f"reddit_{agent_idx}", {}) or {}
-            twitter_response = twitter_result.get("response", "") or ""
-            reddit_response = reddit_result.get("response", "") or ""
-
-            parts = []
-            if twitter_response:
-                parts.append(f"【Twitter平台回答】\n{twitter_response}")
-            if reddit_response:
-                parts.append(f"【Reddit平台回答】\n{reddit_response}")
-            response_text = "\n\n".join(parts) if parts else "[无回复]"
-
-            result.interviews.append(
+            agent = profiles[agent_idx] if agent_idx < len(profiles) else empty
+            if "realname" in agent:
+                agent_name = agent["realname"]
+            else:
+                agent_name = agent.get("username", f"Agent_{agent_idx}")
+
+            twitter_response = (results_dict.get(f"twitter_{agent_idx}") or empty).get("response") or ""
+            reddit_response = (results_dict.get(f"reddit_{agent_idx}") or empty).get("response") or ""
+            response_text = "\n\n".join(
+                f"【{platform}平台回答】\n{text}"
+                for platform, text in (("Twitter", twitter_response), ("Reddit", reddit_response))
+                if text
+            ) or "[无回复]"
+
+            interviews.append(
                 AgentInterview(
                     agent_name=agent_name,
-                    agent_role=agent_role,
-                    agent_bio=(agent_bio or "")[:1000],
+                    agent_role=agent.get("profession", "未知"),
+                    agent_bio=(agent.get("bio") or "")[:1000],
                     question=combined_prompt,
                     response=response_text,
                     key_quotes=[],
@@ -194,25 +345,23 @@ class LocalToolsService:
 
     def quick_search(self, graph_id: str, query: str, limit: int = 10) -> SearchResult:
         facts: List[str] = []
-        if self.vector_store is not None:
+        # A blank query would still cost an embedding and a Qdrant round trip for arbitrary hits.
+        vector_store = self._get_vector_store() if query.strip() else None
+        if vector_store is not None:
             try:
-                items = self.vector_store.search_chunks(
+                items = vector_store.search_chunks(
                     project_id=None,
                     graph_id=graph_id,
                     query=query,
                     limit=limit,
                 )
-                facts = [i.get("text", "") for i in items if i.get("text")]
+                facts = [t for t in (i.get("text") for i in items) if t]
             except Exception as e:
                 logger.warning(f"Local quick_search vector failed: {e}")
 
         # Fallback: show edge facts from Neo4j
         if not facts:
-            graph = self.graph_store.get_graph_data(graph_id)
-            for e in (graph.get("edges") or [])[:limit]:
-                fact = e.get("fact") or ""
-                if fact:
-                    facts.append(fact)
+            facts = [f for f in (e.get("fact") for e in self.graph_store.get_top_edges(graph_id, limit)) if f]
 
         return SearchResult(
             facts=facts[:limit],
@@ -228,54 +377,35 @@ class LocalToolsService:
         return self.quick_search(graph_id=graph_id, query=query, limit=limit)
 
     def panorama_search(self, graph_id: str, query: str, include_expired: bool = True) -> PanoramaResult:
-        graph = self.graph_store.get_graph_data(graph_id)
-        nodes = graph.get("nodes") or []
-        edges = graph.get("edges") or []
-
         # Facts: prefer vector search results if available, else use edge facts
         facts: List[str] = []
-        if self.vector_store is not None and query:
+        # Blank queries (common from the UI) skip embedding/Qdrant and fall through to edge facts.
+        vector_store = self._get_vector_store() if query.strip() else None
+        if vector_store is not None:
+            # Overlap the Neo4j fetch with the Qdrant search instead of paying both latencies.
+            graph_future = _IO_POOL.submit(self._get_materialized, graph_id)
             try:
-                items = self.vector_store.search_chunks(
+                items = vector_store.search_chunks(
                     project_id=None,
                     graph_id=graph_id,
                     query=query,
                     limit=30,
+                    # Panorama wants broad recall; quick_search keeps the cheaper default beam.
+                    hnsw_ef=128,
                 )
-                facts = [i.get("text", "") for i in items if i.get("text")]
+                facts = [t for t in (i.get("text") for i in items) if t]
             except Exception:
                 facts = []
+            graph = graph_future.result()
+        else:
+            graph = self._get_materialized(graph_id)
 
         if not facts:
-            facts = [e.get("fact") for e in edges if e.get("fact")]
+            facts = list(graph.edge_facts)
 
-        node_infos = [
-            NodeInfo(
-                uuid=n.get("uuid", ""),
-                name=n.get("name", ""),
-                labels=n.get("labels", []) or ["Entity"],
-                summary=n.get("summary", ""),
-                attributes=n.get("attributes", {}) or {},
-            )
-            for n in nodes
-        ]
-
-        edge_infos = [
-            EdgeInfo(
-                uuid=e.get("uuid", ""),
-                name=e.get("name", ""),
-                fact=e.get("fact", ""),
-                source_node_uuid=e.get("source_node_uuid", ""),
-                target_node_uuid=e.get("target_node_uuid", ""),
-                source_node_name=e.get("source_node_name"),
-                target_node_name=e.get("target_node_name"),
-                created_at=e.get("created_at"),
-                valid_at=e.get("valid_at"),
-                invalid_at=e.get("invalid_at"),
-                expired_at=e.get("expired_at"),
-            )
-            for e in edges
-        ]
+        # Copies, so callers can't mutate the cached lists
+        node_infos = list(graph.nodes)
+        edge_infos = list(graph.edges)
 
         result = PanoramaResult(query=query)
         result.all_nodes = node_infos
@@ -283,7 +413,9 @@ class LocalToolsService:
         result.total_nodes = len(node_infos)
         result.total_edges = len(edge_infos)
         result.active_facts = facts
-        result.historical_facts = [] if not include_expired else []
+        # The local backend records no expiry on relations, so there is never anything historical;
+        # include_expired is kept for signature compatibility with ZepToolsService.
+        result.historical_facts = []
         result.active_count = len(result.active_facts)
         result.historical_count = len(result.historical_facts)
         return result
@@ -295,39 +427,56 @@ class LocalToolsService:
         simulation_requirement: str = "",
         report_context: str = "",
     ) -> InsightForgeResult:
-        # Minimal implementation: treat the query as a single sub-query and return semantic facts.
-        search = self.quick_search(graph_id=graph_id, query=query, limit=15)
+        cached = self._cached_graph(graph_id)
+        if cached is None:
+            # Only the rows actually shown are fetched (LIMIT is applied in Cypher), concurrently
+            # with the semantic search below.
+            nodes_future = _IO_POOL.submit(self.graph_store.get_top_nodes, graph_id, 10)
+            edges_future = _IO_POOL.submit(self.graph_store.get_top_edges, graph_id, 20)
 
-        graph = self.graph_store.get_graph_data(graph_id)
-        nodes = graph.get("nodes") or []
-        edges = graph.get("edges") or []
+        # Minimal implementation: treat the query as a single sub-query and return semantic facts.
+        # quick_search itself skips embedding/Qdrant for a blank query and falls back to edge facts.
+        semantic_facts = self.quick_search(graph_id=graph_id, query=query, limit=15).facts
 
         # Pick top entities by occurrence in facts (very rough)
-        entity_insights: List[Dict[str, Any]] = []
-        for n in nodes[:10]:
-            etype = next((l for l in (n.get("labels") or []) if l not in ["Entity", "Node"]), "实体")
-            entity_insights.append(
-                {
-                    "name": n.get("name", ""),
-                    "type": etype,
-                    "summary": n.get("summary", ""),
-                    "related_facts": [],
-                }
-            )
+        if cached is not None:
+            # Warm cache: no Neo4j round trip, and entity types are already resolved.
+            entity_insights: List[Dict[str, Any]] = [
+                {"name": n.name, "type": etype, "summary": n.summary, "related_facts": []}
+                for n, etype in zip(cached.nodes[:10], cached.entity_types[:10])
+            ]
+            relationship_chains = [
+                f"{e.source_node_name or e.source_node_uuid[:8]} --[{e.name or 'REL'}]--> "
+                f"{e.target_node_name or e.target_node_uuid[:8]}"
+                for e in cached.edges[:20]
+            ]
+        else:
+            entity_insights = []
+            for n in nodes_future.result():
+                etype = next((l for l in (n.get("labels") or []) if l not in ["Entity", "Node"]), "实体")
+                entity_insights.append(
+                    {
+                        "name": n.get("name", ""),
+                        "type": etype,
+                        "summary": n.get("summary", ""),
+                        "related_facts": [],
+                    }
+                )
 
-        relationship_chains = []
-        for e in edges[:20]:
-            s = e.get("source_node_name") or e.get("source_node_uuid", "")[:8]
-            t = e.get("target_node_name") or e.get("target_node_uuid", "")[:8]
-            rel = e.get("name") or e.get("fact_type") or "REL"
-            relationship_chains.append(f"{s} --[{rel}]--> {t}")
+            relationship_chains = []
+            for e in edges_future.result():
+                get = e.get
+                s = get("source_node_name") or (get("source_node_uuid") or "")[:8]
+                t = get("target_node_name") or (get("target_node_uuid") or "")[:8]
+                rel = get("name") or get("fact_type") or "REL"
+                relationship_chains.append(f"{s} --[{rel}]--> {t}")
 
         result = InsightForgeResult(
             query=query,
             simulation_requirement=simulation_requirement or "",
             sub_queries=[query],
         )
-        result.semantic_facts = search.facts
+        result.semantic_facts = semantic_facts
         result.entity_insights = entity_insights
         result.relationship_chains = relationship_chains
         result.total_facts = len(result.semantic_facts)
@@ -337,17 +486,34 @@ class LocalToolsService:
 
     # Backward-compatible helpers used by ReportAgent
     def get_graph_statistics(self, graph_id: str) -> Dict[str, Any]:
-        g = self.graph_store.get_graph_data(graph_id)
-        return {"graph_id": graph_id, "node_count": g.get("node_count", 0), "edge_count": g.get("edge_count", 0)}
+        now = time.monotonic()
+        with self._graph_cache_lock:
+            cached = self._stats_cache.get(graph_id)
+            if cached is not None and now - cached[0] >= _STATS_CACHE_TTL_SECONDS:
+                del self._stats_cache[graph_id]
+                cached = None
+            generation = self._cache_generation
+        if cached is not None:
+            counts = cached[1]
+        else:
+            counts = self.graph_store.get_counts(graph_id)
+            with self._graph_cache_lock:
+                if generation == self._cache_generation:
+                    self._stats_cache[graph_id] = (now, counts)
+                    self._stats_cache.move_to_end(graph_id)
+                    while len(self._stats_cache) > _STATS_CACHE_MAX_ENTRIES:
+                        self._stats_cache.popitem(last=False)
+        return {"graph_id": graph_id, **counts}
 
     def get_entities_by_type(self, graph_id: str, entity_type: str) -> List[NodeInfo]:
-        g = self.graph_store.get_graph_data(graph_id)
-        nodes = g.get("nodes") or []
+        if not entity_type or entity_type == "Entity":
+            # Every node carries the "Entity" label, so there is nothing to filter on.
+            return list(self._get_materialized(graph_id).nodes)
+
+        items = self.graph_store.get_nodes_by_type(graph_id, [entity_type], exact=True)
         out: List[NodeInfo] = []
-        for n in nodes:
+        for n in (item["node"] for item in items):
             labels = n.get("labels") or []
-            if entity_type and entity_type not in labels:
-                continue
             out.append(
                 NodeInfo(
                     uuid=n.get("uuid", ""),
@@ -360,9 +526,23 @@ class LocalToolsService:
         return out
 
     def get_entity_summary(self, graph_id: str, entity_name: str) -> Dict[str, Any]:
-        g = self.graph_store.get_graph_data(graph_id)
-        for n in g.get("nodes") or []:
-            if (n.get("name") or "").strip() == (entity_name or "").strip():
+        key = (entity_name or "").strip()
+        # A warm graph cache answers from its name index; otherwise do one index seek in Neo4j
+        # rather than loading the whole graph for a single name.
+        cached = self._cached_graph(graph_id)
+        if cached is not None:
+            idx = cached.name_index.get(key)
+            if idx is not None:
+                node = cached.nodes[idx]
+                return {
+                    "name": node.name,
+                    "type": cached.entity_types[idx],
+                    "summary": node.summary,
+                    "attributes": node.attributes,
+                }
+        else:
+            n = self.graph_store.find_entity(graph_id, key)
+            if n is not None:
                 etype = next((l for l in (n.get("labels") or []) if l not in ["Entity", "Node"]), "实体")
                 return {
                     "name": n.get("name", ""),
@@ -395,20 +575,12 @@ class LocalToolsService:
         search = self.quick_search(graph_id=graph_id, query=q, limit=limit)
         stats = self.get_graph_statistics(graph_id)
 
-        g = self.graph_store.get_graph_data(graph_id)
-        entities: List[Dict[str, Any]] = []
-        for n in g.get("nodes") or []:
-            labels = n.get("labels") or []
-            custom_labels = [l for l in labels if l not in ["Entity", "Node"]]
-            if not custom_labels:
-                continue
-            entities.append(
-                {
-                    "name": n.get("name", ""),
-                    "type": custom_labels[0],
-                    "summary": n.get("summary", ""),
-                }
-            )
+        nodes = self.graph_store.get_graph_columns(graph_id, decode_attributes=False)["nodes"]
+        entities: List[Dict[str, Any]] = [
+            {"name": name, "type": labels[1], "summary": summary}
+            for name, labels, summary in zip(nodes["name"], nodes["labels"], nodes["summary"])
+            if labels[1] not in ("Entity", "Node")
+        ]
 
         return {
             "simulation_requirement": simulation_requirement,
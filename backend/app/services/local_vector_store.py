@@ -6,43 +6,89 @@ Stores chunk embeddings and metadata, isolated by project_id.
 
 from __future__ import annotations
 
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qmodels
 
 from ..config import Config
 from ..utils.logger import get_logger
-from ..utils.llm_client import LLMClient
+from ..utils.llm_client import LLMClient, get_llm_client
 
 logger = get_logger("mirofish.local_vector_store")
 
+# Payload fields search_chunks() returns; anything else (extra_payload) stays on the server.
+_RESULT_PAYLOAD_FIELDS = qmodels.PayloadSelectorInclude(include=["chunk_id", "text", "graph_id", "created_at"])
+
+# Oversample on the quantized vectors, then rescore with the originals so recall is preserved.
+# Ignored by collections created without quantization.
+_QUANTIZATION_SEARCH_PARAMS = qmodels.QuantizationSearchParams(rescore=True, oversampling=2.0)
+
+# Floor for the per-request HNSW beam width (hnsw_ef); larger limits scale it up
+_MIN_HNSW_EF = 64
+
+
+# Repeated (project_id, graph_id, query, limit) searches are answered from memory for this long
+_SEARCH_CACHE_TTL_SECONDS = 300
+_SEARCH_CACHE_MAX_ENTRIES = 1024
+# (project_id, graph_id, query, limit, include_full_payload, hnsw_ef)
+_SearchKey = Tuple[str, str, str, int, bool, Optional[int]]
+
+# Collections already checked/created by this process
+_ENSURED_COLLECTIONS: Set[str] = set()
+_ENSURED_COLLECTIONS_LOCK = threading.Lock()
+
 
 def _now_iso() -> str:
     return datetime.now().isoformat()
 
 
+@lru_cache(maxsize=8)
+def _get_qdrant_client(url: str, api_key: Optional[str], prefer_grpc: bool, grpc_port: int) -> QdrantClient:
+    """One QdrantClient (and its connection pool / gRPC channel) per endpoint for the whole process."""
+    return QdrantClient(
+        url=url,
+        api_key=api_key,
+        prefer_grpc=prefer_grpc,
+        grpc_port=grpc_port,
+        timeout=30,
+    )
+
+
 class QdrantChunkStore:
     def __init__(self, llm: Optional[LLMClient] = None):
-        self._client = QdrantClient(
-            url=Config.QDRANT_URL,
-            api_key=Config.QDRANT_API_KEY,
-            timeout=30.0,
+        self._client = _get_qdrant_client(
+            Config.QDRANT_URL,
+            Config.QDRANT_API_KEY,
+            Config.QDRANT_USE_GRPC,
+            Config.QDRANT_GRPC_PORT,
         )
         self._collection = Config.QDRANT_COLLECTION_CHUNKS
-        self._llm = llm or LLMClient(
-            api_key=Config.EMBEDDING_API_KEY,
-            base_url=Config.EMBEDDING_BASE_URL,
-            model=Config.LLM_MODEL_NAME,
-        )
-        self._ensure_collection()
+        self._llm = llm or get_llm_client("embedding")
+        # key -> (stored_at, items); LRU order, oldest first
+        self._search_cache: OrderedDict[_SearchKey, Tuple[float, List[Dict[str, Any]]]] = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        # Bumped by clear_search_cache() (per graph_id key, and overall for a full clear) so
+        # searches that started before a clear do not store their results afterwards
+        self._search_generations: Dict[str, int] = {}
+        self._search_generation = 0
+        # get_collection (and on a cold start an embedding call) only once per collection per process
+        with _ENSURED_COLLECTIONS_LOCK:
+            if self._collection not in _ENSURED_COLLECTIONS:
+                self._ensure_collection()
+                _ENSURED_COLLECTIONS.add(self._collection)
 
     def _ensure_collection(self):
         try:
             existing = self._client.get_collection(self._collection)
             _ = existing  # silence lint
+            self._ensure_payload_indexes()
             return
         except Exception:
             pass
@@ -62,8 +108,30 @@ class QdrantChunkStore:
                 size=len(vec),
                 distance=qmodels.Distance.COSINE,
             ),
+            hnsw_config=qmodels.HnswConfigDiff(m=16, ef_construct=100),
+            # int8 copies of the vectors in RAM for the HNSW search; originals are kept for rescoring
+            quantization_config=qmodels.ScalarQuantization(
+                scalar=qmodels.ScalarQuantizationConfig(
+                    type=qmodels.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                ),
+            ),
         )
         logger.info(f"Created Qdrant collection: {self._collection} size={len(vec)}")
+        self._ensure_payload_indexes()
+
+    def _ensure_payload_indexes(self) -> None:
+        # search_chunks always filters on these; keyword indexes keep filtered HNSW search exact.
+        for field_name in ("project_id", "graph_id"):
+            try:
+                self._client.create_payload_index(
+                    collection_name=self._collection,
+                    field_name=field_name,
+                    field_schema=qmodels.PayloadSchemaType.KEYWORD,
+                )
+            except Exception as e:
+                logger.warning(f"Qdrant payload index {field_name} failed: {str(e)[:120]}")
 
     def add_chunk(
         self,
@@ -73,30 +141,60 @@ class QdrantChunkStore:
         text: str,
         extra_payload: Optional[Dict[str, Any]] = None,
     ) -> str:
-        point_id = uuid.uuid4().hex
-        vectors = self._llm.embed_texts([text], model=Config.EMBEDDING_MODEL_NAME)[0]
-
-        payload: Dict[str, Any] = {
-            "project_id": project_id,
-            "graph_id": graph_id,
-            "chunk_id": chunk_id,
-            "text": text,
-            "created_at": _now_iso(),
-        }
-        if extra_payload:
-            payload.update(extra_payload)
+        # Single writes block until Qdrant acknowledges them, as before add_chunks existed.
+        return self.add_chunks(project_id, graph_id, [(chunk_id, text)], extra_payload=extra_payload, wait=True)[0]
 
-        self._client.upsert(
-            collection_name=self._collection,
-            points=[
-                qmodels.PointStruct(
-                    id=point_id,
-                    vector=vectors,
-                    payload=payload,
-                )
-            ],
-        )
-        return point_id
+    def add_chunks(
+        self,
+        project_id: str,
+        graph_id: str,
+        chunks: Sequence[Tuple[str, str]],
+        extra_payload: Optional[Dict[str, Any]] = None,
+        wait: bool = False,
+    ) -> List[str]:
+        """
+        Batched variant of add_chunk: one embeddings request and one Qdrant upsert
+        for all (chunk_id, text) pairs.
+
+        With wait=False Qdrant indexes the points in the background. Pass wait=True on the last
+        batch of a build: once it is acknowledged (updates apply in order) the graph's cached
+        search results are dropped, so no search can cache results missing the new chunks.
+        """
+        if not chunks:
+            return []
+        vectors = self._llm.embed_texts([text for _, text in chunks], model=Config.EMBEDDING_MODEL_NAME)
+        created_at = _now_iso()
+
+        points: List[qmodels.PointStruct] = []
+        for (chunk_id, text), vector in zip(chunks, vectors):
+            payload: Dict[str, Any] = {
+                "project_id": project_id,
+                "graph_id": graph_id,
+                "chunk_id": chunk_id,
+                "text": text,
+                "created_at": created_at,
+            }
+            if extra_payload:
+                payload.update(extra_payload)
+            points.append(qmodels.PointStruct(id=uuid.uuid4().hex, vector=vector, payload=payload))
+
+        self._client.upsert(collection_name=self._collection, points=points, wait=wait)
+        if wait:
+            self.clear_search_cache(graph_id)
+        return [str(p.id) for p in points]
+
+    def clear_search_cache(self, graph_id: Optional[str] = None) -> None:
+        """Drop cached search results for graph_id, or all of them when graph_id is None."""
+        with self._search_cache_lock:
+            if graph_id is None:
+                self._search_cache.clear()
+                self._search_generation += 1
+                return
+            # Searches without a graph filter may also match the new chunks
+            for key in [k for k in self._search_cache if k[1] in (graph_id, "")]:
+                del self._search_cache[key]
+            for graph_key in (graph_id, ""):
+                self._search_generations[graph_key] = self._search_generations.get(graph_key, 0) + 1
 
     def search_chunks(
         self,
@@ -104,34 +202,149 @@ class QdrantChunkStore:
         graph_id: Optional[str],
         query: str,
         limit: int = 10,
+        include_full_payload: bool = False,
+        hnsw_ef: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        query_vector = self._llm.embed_texts([query], model=Config.EMBEDDING_MODEL_NAME)[0]
+        """
+        Semantic search over stored chunks.
+
+        Only the fields used in results are fetched from Qdrant unless include_full_payload
+        is set, in which case each item also carries the complete payload under "payload".
+        hnsw_ef overrides the default beam width of max(64, 4 * limit) for broader recall.
+        Results are cached in memory for a few minutes; add_chunks(wait=True) invalidates the graph's entries.
+        """
+        key = (project_id or "", graph_id or "", query, limit, include_full_payload, hnsw_ef)
+        now = time.monotonic()
+        cached, generation = self._cache_lookup(key, now)
+        if cached is not None:
+            return cached
+
+        query_vector = self._llm.embed_query(query, model=Config.EMBEDDING_MODEL_NAME)
+        results = self._client.query_points(
+            **self._query_kwargs(project_id, graph_id, query_vector, limit, include_full_payload, hnsw_ef)
+        ).points
+        items = self._to_items(results, include_full_payload)
+        self._cache_store(key, generation, now, items)
+        return list(items)
+
+    def search_chunks_batch(
+        self,
+        project_id: Optional[str],
+        graph_id: Optional[str],
+        queries: Sequence[str],
+        limit: int = 10,
+        include_full_payload: bool = False,
+        hnsw_ef: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        search_chunks() for several queries at once. Queries not in the search cache are
+        embedded like search_chunks() does and sent in one Qdrant query_batch_points round trip.
+        Results are aligned with queries.
+        """
+        now = time.monotonic()
+        out: List[List[Dict[str, Any]]] = []
+        misses: List[Tuple[int, _SearchKey, Tuple[int, int]]] = []
+        requests: List[qmodels.QueryRequest] = []
+        for i, query in enumerate(queries):
+            key = (project_id or "", graph_id or "", query, limit, include_full_payload, hnsw_ef)
+            cached, generation = self._cache_lookup(key, now)
+            if cached is not None:
+                out.append(cached)
+                continue
+            out.append([])
+            vector = self._llm.embed_query(query, model=Config.EMBEDDING_MODEL_NAME)
+            kwargs = self._query_kwargs(project_id, graph_id, vector, limit, include_full_payload, hnsw_ef)
+            misses.append((i, key, generation))
+            requests.append(
+                qmodels.QueryRequest(
+                    query=kwargs["query"],
+                    filter=kwargs["query_filter"],
+                    params=kwargs["search_params"],
+                    limit=limit,
+                    with_payload=kwargs["with_payload"],
+                )
+            )
+        if requests:
+            responses = self._client.query_batch_points(collection_name=self._collection, requests=requests)
+            for (i, key, generation), response in zip(misses, responses):
+                items = self._to_items(response.points, include_full_payload)
+                self._cache_store(key, generation, now, items)
+                out[i] = list(items)
+        return out
+
+    def _cache_lookup(
+        self, key: _SearchKey, now: float
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Tuple[int, int]]:
+        """Return (a copy of the cached items or None, the cache generation to pass to _cache_store)."""
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None and now - cached[0] < _SEARCH_CACHE_TTL_SECONDS:
+                self._search_cache.move_to_end(key)
+                return list(cached[1]), (0, 0)
+            return None, (self._search_generation, self._search_generations.get(key[1], 0))
 
+    def _cache_store(
+        self,
+        key: _SearchKey,
+        generation: Tuple[int, int],
+        now: float,
+        items: List[Dict[str, Any]],
+    ) -> None:
+        # Skip storing if clear_search_cache() ran since the lookup
+        with self._search_cache_lock:
+            if generation == (self._search_generation, self._search_generations.get(key[1], 0)):
+                self._search_cache[key] = (now, items)
+                self._search_cache.move_to_end(key)
+                while len(self._search_cache) > _SEARCH_CACHE_MAX_ENTRIES:
+                    self._search_cache.popitem(last=False)
+
+    def _query_kwargs(
+        self,
+        project_id: Optional[str],
+        graph_id: Optional[str],
+        query_vector: List[float],
+        limit: int,
+        include_full_payload: bool,
+        hnsw_ef: Optional[int] = None,
+    ) -> Dict[str, Any]:
         must = []
         if project_id:
             must.append(qmodels.FieldCondition(key="project_id", match=qmodels.MatchValue(value=project_id)))
         if graph_id:
             must.append(qmodels.FieldCondition(key="graph_id", match=qmodels.MatchValue(value=graph_id)))
 
-        results = self._client.search(
-            collection_name=self._collection,
-            query_vector=query_vector,
-            limit=limit,
-            query_filter=qmodels.Filter(must=must) if must else None,
-            with_payload=True,
-        )
+        return {
+            "collection_name": self._collection,
+            "query": query_vector,
+            "limit": limit,
+            "query_filter": qmodels.Filter(must=must) if must else None,
+            "search_params": qmodels.SearchParams(
+                hnsw_ef=hnsw_ef or max(_MIN_HNSW_EF, limit * 4),
+                exact=False,
+                quantization=_QUANTIZATION_SEARCH_PARAMS,
+            ),
+            "with_payload": True if include_full_payload else _RESULT_PAYLOAD_FIELDS,
+        }
 
+    @staticmethod
+    def _to_items(results: Sequence[Any], include_full_payload: bool) -> List[Dict[str, Any]]:
         items: List[Dict[str, Any]] = []
         for r in results:
             payload = r.payload or {}
-            items.append(
-                {
-                    "score": float(r.score),
-                    "chunk_id": payload.get("chunk_id"),
-                    "text": payload.get("text", ""),
-                    "graph_id": payload.get("graph_id"),
-                    "created_at": payload.get("created_at"),
-                    "payload": payload,
-                }
-            )
+            item = {
+                "score": float(r.score),
+                "chunk_id": payload.get("chunk_id"),
+                "text": payload.get("text", ""),
+                "graph_id": payload.get("graph_id"),
+                "created_at": payload.get("created_at"),
+            }
+            if include_full_payload:
+                item["payload"] = payload
+            items.append(item)
         return items
+
+
+@lru_cache(maxsize=1)
+def get_qdrant_chunk_store() -> QdrantChunkStore:
+    """Process-wide store so every service shares one Qdrant client. Init failures are not cached."""
+    return QdrantChunkStore()
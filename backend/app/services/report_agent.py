@@ -19,7 +19,7 @@ from datetime import datetime
 from enum import Enum
 
 from ..config import Config
-from ..utils.llm_client import LLMClient
+from ..utils.llm_client import LLMClient, get_llm_client
 from ..utils.logger import get_logger
 from .zep_tools import (
     SearchResult, 
@@ -527,11 +527,7 @@ class ReportAgent:
         if llm_client is not None:
             self.llm = llm_client
         else:
-            self.llm = LLMClient(
-                api_key=Config.REPORT_API_KEY,
-                base_url=Config.REPORT_BASE_URL,
-                model=Config.REPORT_MODEL_NAME,
-            )
+            self.llm = get_llm_client("report")
         self.zep_tools = zep_tools or get_tools_service()
         
         # 工具定义
@@ -2,8 +2,8 @@
 文本处理服务
 """
 
-from typing import List, Optional
-from ..utils.file_parser import FileParser, split_text_into_chunks
+from typing import Iterator, List, Optional
+from ..utils.file_parser import FileParser, iter_text_chunks, split_text_into_chunks
 
 
 class TextProcessor:
@@ -33,6 +33,25 @@ class TextProcessor:
         """
         return split_text_into_chunks(text, chunk_size, overlap)
     
+    @staticmethod
+    def iter_text(
+        text: str,
+        chunk_size: int = 500,
+        overlap: int = 50
+    ) -> Iterator[str]:
+        """
+        分割文本（流式版本，边切块边产出，适合与下游抽取并行）
+        
+        Args:
+            text: 原始文本
+            chunk_size: 块大小
+            overlap: 重叠大小
+            
+        Yields:
+            文本块
+        """
+        return iter_text_chunks(text, chunk_size, overlap)
+    
     @staticmethod
     def preprocess_text(text: str) -> str:
         """
@@ -2,20 +2,33 @@
 Tools service backend factory.
 
 Switches between ZepToolsService and LocalToolsService based on Config.GRAPH_BACKEND.
+The local service only holds process-wide store singletons, so one instance is shared.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from ..config import Config
 
 
 def get_tools_service():
     if Config.GRAPH_BACKEND == "local":
-        from .local_tools import LocalToolsService
-
-        return LocalToolsService()
+        return _get_local_tools_service()
 
     from .zep_tools import ZepToolsService
 
     return ZepToolsService()
 
+
+@lru_cache(maxsize=1)
+def _get_local_tools_service():
+    from .local_tools import LocalToolsService
+
+    return LocalToolsService()
+
+
+def invalidate_local_graph_caches(graph_id: str) -> None:
+    """Drop the shared local service's cached data for graph_id; a no-op until it has been created."""
+    if _get_local_tools_service.cache_info().currsize:
+        _get_local_tools_service().invalidate_graph(graph_id)
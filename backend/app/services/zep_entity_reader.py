@@ -18,7 +18,7 @@ logger = get_logger('mirofish.zep_entity_reader')
 T = TypeVar('T')
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityNode:
     """实体节点数据结构"""
     uuid: str
@@ -17,7 +17,7 @@ from zep_cloud.client import Zep
 
 from ..config import Config
 from ..utils.logger import get_logger
-from ..utils.llm_client import LLMClient
+from ..utils.llm_client import LLMClient, get_llm_client
 
 logger = get_logger('mirofish.zep_tools')
 
@@ -52,7 +52,7 @@ class SearchResult:
         return "\n".join(text_parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeInfo:
     """节点信息"""
     uuid: str
@@ -76,7 +76,7 @@ class NodeInfo:
         return f"实体: {self.name} (类型: {entity_type})\n摘要: {self.summary}"
 
 
-@dataclass
+@dataclass(slots=True)
 class EdgeInfo:
     """边信息"""
     uuid: str
@@ -412,7 +412,7 @@ class ZepToolsService:
     def llm(self) -> LLMClient:
         """延迟初始化LLM客户端"""
         if self._llm_client is None:
-            self._llm_client = LLMClient()
+            self._llm_client = get_llm_client()
         return self._llm_client
     
     def _call_with_retry(self, func, operation_name: str, max_retries: int = None):
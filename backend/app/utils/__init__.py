@@ -3,7 +3,7 @@
 """
 
 from .file_parser import FileParser
-from .llm_client import LLMClient
+from .llm_client import LLMClient, get_llm_client
 
-__all__ = ['FileParser', 'LLMClient']
+__all__ = ['FileParser', 'LLMClient', 'get_llm_client']
 
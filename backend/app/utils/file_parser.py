@@ -5,7 +5,7 @@
 
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 
 class FileParser:
@@ -96,26 +96,27 @@ class FileParser:
         return "\n\n".join(all_texts)
 
 
-def split_text_into_chunks(
+def iter_text_chunks(
     text: str, 
     chunk_size: int = 500, 
     overlap: int = 50
-) -> List[str]:
+) -> Iterator[str]:
     """
-    将文本分割成小块
+    将文本分割成小块（生成器版本，按需逐块产出）
     
     Args:
         text: 原始文本
         chunk_size: 每块的字符数
         overlap: 重叠字符数
         
-    Returns:
-        文本块列表
+    Yields:
+        文本块
     """
     if len(text) <= chunk_size:
-        return [text] if text.strip() else []
+        if text.strip():
+            yield text
+        return
     
-    chunks = []
     start = 0
     
     while start < len(text):
@@ -132,10 +133,26 @@ def split_text_into_chunks(
         
         chunk = text[start:end].strip()
         if chunk:
-            chunks.append(chunk)
+            yield chunk
         
         # 下一个块从重叠位置开始
         start = end - overlap if end < len(text) else len(text)
-    
-    return chunks
 
+
+def split_text_into_chunks(
+    text: str, 
+    chunk_size: int = 500, 
+    overlap: int = 50
+) -> List[str]:
+    """
+    将文本分割成小块
+    
+    Args:
+        text: 原始文本
+        chunk_size: 每块的字符数
+        overlap: 重叠字符数
+        
+    Returns:
+        文本块列表
+    """
+    return list(iter_text_chunks(text, chunk_size, overlap))
@@ -5,15 +5,51 @@ LLM客户端封装
 
 import json
 import re
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from openai import OpenAI
 
 from ..config import Config
 
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时回退到标准库 json
+    orjson = None
+
+if orjson is not None:
+    def _loads(s: str) -> Any:
+        """解析模型返回的 JSON；orjson 不接受 NaN/Infinity 和超过 64 位的整数，失败时交给标准库再试"""
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return json.loads(s)
+else:
+    _loads = json.loads
+
+
+@lru_cache(maxsize=8)
+def _get_openai_client(api_key: Optional[str], base_url: Optional[str]) -> OpenAI:
+    """按 (api_key, base_url) 共享 OpenAI 客户端，使直接构造的 LLMClient 也复用同一连接池"""
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+@lru_cache(maxsize=256)
+def _embed_one(api_key: Optional[str], base_url: Optional[str], model: str, text: str) -> tuple:
+    """
+    单条文本（检索 query）的 embedding 缓存，同一问题被多个工具重复检索时不再请求接口
+
+    模块级缓存按共享客户端的 (api_key, base_url) 区分，所有 LLMClient 实例共用，且不持有实例引用
+    """
+    resp = _get_openai_client(api_key, base_url).embeddings.create(model=model, input=[text])
+    # 以 tuple 缓存，避免调用方修改共享的向量
+    return tuple(resp.data[0].embedding)
+
 
 class LLMClient:
     """LLM客户端"""
 
+    _V1_RE = re.compile(r"/v1$")
+
     @staticmethod
     def _normalize_base_url(url: str) -> str:
         """
@@ -24,7 +60,7 @@ class LLMClient:
         if not url:
             return url
         u = url.strip().rstrip("/")
-        if re.search(r"/v1$", u):
+        if LLMClient._V1_RE.search(u):
             return u
         return f"{u}/v1"
 
@@ -33,19 +69,19 @@ class LLMClient:
         if not text:
             return None
         s = text.strip()
+        # One pass over the candidate delimiters, reused by every check below
+        obj_start, obj_end = s.find("{"), s.rfind("}")
+        arr_start, arr_end = s.find("["), s.rfind("]")
+        last = len(s) - 1
         # If already an object/array
-        if (s.startswith("{") and s.endswith("}")) or (s.startswith("[") and s.endswith("]")):
+        if (obj_start == 0 and obj_end == last) or (arr_start == 0 and arr_end == last):
             return s
         # Try to find a JSON object substring
-        start = s.find("{")
-        end = s.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            return s[start : end + 1]
+        if obj_start != -1 and obj_end > obj_start:
+            return s[obj_start : obj_end + 1]
         # Try array
-        start = s.find("[")
-        end = s.rfind("]")
-        if start != -1 and end != -1 and end > start:
-            return s[start : end + 1]
+        if arr_start != -1 and arr_end > arr_start:
+            return s[arr_start : arr_end + 1]
         return None
     
     def __init__(
@@ -61,15 +97,11 @@ class LLMClient:
         if not self.api_key:
             raise ValueError("LLM_API_KEY 未配置")
         
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url
-        )
+        self.client = _get_openai_client(self.api_key, self.base_url)
         # Embeddings client (may use different key/base_url)
-        self._embedding_client = OpenAI(
-            api_key=Config.EMBEDDING_API_KEY,
-            base_url=self._normalize_base_url(Config.EMBEDDING_BASE_URL),
-        )
+        self._embedding_api_key = Config.EMBEDDING_API_KEY
+        self._embedding_base_url = self._normalize_base_url(Config.EMBEDDING_BASE_URL)
+        self._embedding_client = _get_openai_client(self._embedding_api_key, self._embedding_base_url)
     
     def chat(
         self,
@@ -129,14 +161,14 @@ class LLMClient:
         )
 
         try:
-            parsed = json.loads(response)
+            parsed = _loads(response)
             if isinstance(parsed, dict):
                 return parsed
             # Some providers return a JSON string instead of an object; try decode again.
             if isinstance(parsed, str):
                 maybe = self._extract_json_object(parsed)
                 if maybe:
-                    parsed2 = json.loads(maybe)
+                    parsed2 = _loads(maybe)
                     if isinstance(parsed2, dict):
                         return parsed2
         except Exception:
@@ -162,7 +194,7 @@ class LLMClient:
         maybe = self._extract_json_object(response2)
         if not maybe:
             raise ValueError(f"模型未返回可解析的JSON对象: {response2[:200]}")
-        parsed = json.loads(maybe)
+        parsed = _loads(maybe)
         if not isinstance(parsed, dict):
             raise ValueError(f"JSON解析结果不是对象: {type(parsed).__name__}")
         return parsed
@@ -171,10 +203,51 @@ class LLMClient:
         """
         生成 embeddings（用于向量库）
         """
-        embed_model = model or Config.EMBEDDING_MODEL_NAME
         resp = self._embedding_client.embeddings.create(
-            model=embed_model,
+            model=model or Config.EMBEDDING_MODEL_NAME,
             input=texts,
         )
         return [d.embedding for d in resp.data]
 
+    def embed_query(self, text: str, model: Optional[str] = None) -> List[float]:
+        """
+        生成单条检索 query 的 embedding（带缓存）
+
+        仅用于检索路径；入库的 chunk 文本各不相同，应走 embed_texts，避免挤掉缓存中的 query 向量
+        """
+        embed_model = model or Config.EMBEDDING_MODEL_NAME
+        return list(_embed_one(self._embedding_api_key, self._embedding_base_url, embed_model, text))
+
+
+@lru_cache(maxsize=4)
+def get_llm_client(kind: str = "default") -> LLMClient:
+    """
+    按用途获取进程内共享的 LLMClient，复用底层 HTTP 连接池（keep-alive），避免重复 TLS 握手
+
+    Args:
+        kind: default | extract | report | embedding
+        
+    Returns:
+        共享的 LLMClient 实例
+    """
+    if kind == "extract":
+        return LLMClient(
+            api_key=Config.EXTRACT_API_KEY,
+            base_url=Config.EXTRACT_BASE_URL,
+            model=Config.EXTRACT_MODEL_NAME,
+        )
+    if kind == "report":
+        return LLMClient(
+            api_key=Config.REPORT_API_KEY,
+            base_url=Config.REPORT_BASE_URL,
+            model=Config.REPORT_MODEL_NAME,
+        )
+    if kind == "embedding":
+        return LLMClient(
+            api_key=Config.EMBEDDING_API_KEY,
+            base_url=Config.EMBEDDING_BASE_URL,
+            model=Config.LLM_MODEL_NAME,
+        )
+    if kind != "default":
+        raise ValueError(f"未知的 LLM 客户端类型: {kind}")
+    return LLMClient()
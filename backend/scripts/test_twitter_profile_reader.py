@@ -0,0 +1,40 @@
+"""
+测试本地模式 twitter_profiles.csv 读取
+验证：空行（文件末尾多余换行、行间空行）不会被解析成空的 Agent 人设
+"""
+
+import os
+import sys
+import tempfile
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.local_tools import _read_twitter_profiles
+
+
+def test_twitter_profiles_skip_blank_lines():
+    """CSV 中的空行应被跳过"""
+    content = (
+        "user_id,username,name,description,user_char\n"
+        "0,user0,User Zero,Bio zero,Persona zero\n"
+        "\n"
+        "1,user1,User One,Bio one,Persona one\n"
+        "\n"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "twitter_profiles.csv")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+
+        profiles = _read_twitter_profiles(path, os.path.getmtime(path))
+
+    assert len(profiles) == 2, f"期望 2 个人设，实际 {len(profiles)}"
+    assert [p["realname"] for p in profiles] == ["User Zero", "User One"]
+    assert [p["username"] for p in profiles] == ["user0", "user1"]
+    assert [p["persona"] for p in profiles] == ["Persona zero", "Persona one"]
+    print("[通过] 空行已跳过，共读取 2 个人设")
+
+
+if __name__ == "__main__":
+    test_twitter_profiles_skip_blank_lines()